@@ -25,7 +25,7 @@ def _():
     import sys
 
     print(sys.version)
-    return
+    return (sys,)
 
 
 @app.cell
@@ -194,6 +194,14 @@ def _(
             df_racer_results = pl.read_parquet(path_res)
             df_races = pl.read_parquet(path_races)
             df_positions = pl.read_parquet(path_positions)
+
+        # config_hash is stored as a 16-byte digest; use hex strings in the UI
+        df_racer_results, df_races, df_positions = (
+            df.with_columns(pl.col("config_hash").bin.encode("hex"))
+            if df.schema.get("config_hash") == pl.Binary
+            else df
+            for df in (df_racer_results, df_races, df_positions)
+        )
         load_status = f"✅ Loaded from: `{base_folder}`"
 
     except Exception as e:
@@ -287,6 +295,7 @@ def _(df_racer_results, df_races, mo, pl):
 
 @app.cell
 def _(BG_COLOR, math):
+    import functools
     from typing import NamedTuple
 
     # --- DATA STRUCTURES ---
@@ -368,6 +377,7 @@ def _(BG_COLOR, math):
     def get_racer_color(name: str) -> str:
         return get_racer_palette(name).primary
 
+    @functools.lru_cache(maxsize=4)
     def generate_racetrack_positions(
         num_spaces, start_x, start_y, straight_len, radius
     ):
@@ -375,9 +385,15 @@ def _(BG_COLOR, math):
         Generates a Clockwise stadium track starting from the Top-Left straight.
         """
         positions = []
-        perimeter = (2 * straight_len) + (2 * math.pi * radius)
+        half_circle = math.pi * radius
+        perimeter = (2 * straight_len) + (2 * half_circle)
         step_distance = perimeter / num_spaces
 
+        # Segment boundaries along the perimeter (hoisted out of the loop)
+        right_curve_start = straight_len
+        bottom_start = straight_len + half_circle
+        left_curve_start = 2 * straight_len + half_circle
+
         right_circle_cx = start_x + straight_len
         right_circle_cy = start_y + radius
         left_circle_cx = start_x
@@ -387,28 +403,25 @@ def _(BG_COLOR, math):
             dist = i * step_distance
 
             # 1. Top Straight (Moving Right)
-            if dist < straight_len:
+            if dist < right_curve_start:
                 x = start_x + dist
                 y = start_y
                 angle = 0
             # 2. Right Curve (Moving Clockwise/Down)
-            elif dist < (straight_len + math.pi * radius):
-                arc_dist = dist - straight_len
-                fraction = arc_dist / (math.pi * radius)
+            elif dist < bottom_start:
+                fraction = (dist - right_curve_start) / half_circle
                 theta = (-math.pi / 2) + (fraction * math.pi)
                 x = right_circle_cx + radius * math.cos(theta)
                 y = right_circle_cy + radius * math.sin(theta)
                 angle = math.degrees(theta) + 90
             # 3. Bottom Straight (Moving Left)
-            elif dist < (2 * straight_len + math.pi * radius):
-                top_dist = dist - (straight_len + math.pi * radius)
-                x = (start_x + straight_len) - top_dist
+            elif dist < left_curve_start:
+                x = (start_x + straight_len) - (dist - bottom_start)
                 y = start_y + (2 * radius)
                 angle = 180
             # 4. Left Curve (Moving Clockwise/Up)
             else:
-                arc_dist = dist - (2 * straight_len + math.pi * radius)
-                fraction = arc_dist / (math.pi * radius)
+                fraction = (dist - left_curve_start) / half_circle
                 theta = (math.pi / 2) + (fraction * math.pi)
                 x = left_circle_cx + radius * math.cos(theta)
                 y = left_circle_cy + radius * math.sin(theta)
@@ -416,53 +429,49 @@ def _(BG_COLOR, math):
 
             positions.append((x, y, angle))
 
-        return positions
+        # Tuple: cached result is shared, so it must not be mutated
+        return tuple(positions)
 
     # Constants
     NUM_TILES = 31
     board_positions = generate_racetrack_positions(NUM_TILES, 120, 150, 350, 100)
-    return BOARD_THEME, board_positions, get_racer_color, get_racer_palette
+    return (
+        BOARD_THEME,
+        board_positions,
+        functools,
+        get_racer_color,
+        get_racer_palette,
+    )
 
 
 @app.cell
 def _(
+    BOARD_DEFINITIONS,
     BOARD_THEME,
     MoveDeltaTile,
     StepSnapshot,
     TripTile,
     VictoryPointTile,
+    board_positions,
+    functools,
     get_racer_palette,
     math,
 ):
     # --- RENDERER (RAW / UNPATCHED) ---
-    def render_game_track(turn_data: StepSnapshot, positions_map, board=None):
-        import html as _html
-
-        # --- VISUALIZATION CONSTANTS ---
-        MAIN_RADIUS = 9.0
-        SECONDARY_RADIUS = 8.0
-        OUTLINE_WIDTH = 1.5
-        SECONDARY_WIDTH = 1.5
-        TEXT_STROKE_WIDTH = "4px"
-
-        if not turn_data:
-            return "<p>No Data</p>"
-
-        svg_elements = []
+    # Tile rotations never change, so their trig is computed once per session
+    tile_trig = [
+        (math.cos(math.radians(rot)), math.sin(math.radians(rot)))
+        for _, _, rot in board_positions
+    ]
 
-        # Dimensions & Scaling
-        W, H = 1000, 600
-        scale_factor = 1.45
-        trans_x = 75
-        trans_y = -60
+    @functools.lru_cache(maxsize=8)
+    def render_track_tiles(board_name: str) -> str:
+        """Static tile SVG (rects + labels) for a board, built once per board."""
+        positions_map = board_positions
+        board = BOARD_DEFINITIONS[board_name]()
         rw, rh = 50, 30
+        svg_elements = []
 
-        # 1. Track Groups
-        track_group_start = (
-            f'<g transform="translate({trans_x}, {trans_y}) scale({scale_factor})">'
-        )
-
-        # 2. Track Spaces
         for i, (cx, cy, rot) in enumerate(positions_map):
             transform = f"rotate({rot}, {cx}, {cy})"
 
@@ -533,6 +542,39 @@ def _(
                 f'text-anchor="middle" fill="{text_fill}" transform="{transform}">{text_content}</text>'
             )
 
+        return "".join(svg_elements)
+
+    def render_game_track(turn_data: StepSnapshot, board_name: str = "standard"):
+        import html as _html
+
+        # --- VISUALIZATION CONSTANTS ---
+        MAIN_RADIUS = 9.0
+        SECONDARY_RADIUS = 8.0
+        OUTLINE_WIDTH = 1.5
+        SECONDARY_WIDTH = 1.5
+        TEXT_STROKE_WIDTH = "4px"
+
+        if not turn_data:
+            return "<p>No Data</p>"
+
+        positions_map = board_positions
+        if board_name not in BOARD_DEFINITIONS:
+            board_name = "standard"
+
+        # Dimensions & Scaling
+        W, H = 1000, 600
+        scale_factor = 1.45
+        trans_x = 75
+        trans_y = -60
+
+        # 1. Track Groups
+        track_group_start = (
+            f'<g transform="translate({trans_x}, {trans_y}) scale({scale_factor})">'
+        )
+
+        # 2. Track Spaces (cached per board)
+        svg_elements = [render_track_tiles(board_name)]
+
         # 3. Racers
         occupancy = {}
         for idx, pos in enumerate(turn_data.positions):
@@ -542,8 +584,8 @@ def _(
 
             mods = turn_data.modifiers
             abils = turn_data.abilities
-            mod_str = str(mods[idx]) if idx < len(mods) else "[]"
-            abil_str = str(abils[idx]) if idx < len(abils) else "[]"
+            mod_str = str(list(mods[idx])) if idx < len(mods) else "[]"
+            abil_str = str(list(abils[idx])) if idx < len(abils) else "[]"
             tooltip_text = f"{name} (ID: {idx})\nVP: {turn_data.vp[idx]}\nTripped: {turn_data.tripped[idx]}\nAbils: {abil_str}\nMods: {mod_str}"
 
             occupancy.setdefault(draw_pos, []).append(
@@ -558,7 +600,8 @@ def _(
 
         # Render Racers
         for space_idx, racers_here in occupancy.items():
-            bx, by, brot = positions_map[space_idx]
+            bx, by, _ = positions_map[space_idx]
+            cos_r, sin_r = tile_trig[space_idx]
             count = len(racers_here)
 
             if count == 1:
@@ -575,9 +618,8 @@ def _(
                     break
                 ox, oy = offsets[i]
 
-                rad = math.radians(brot)
-                cx = bx + (ox * math.cos(rad) - oy * math.sin(rad))
-                cy = by + (ox * math.sin(rad) + oy * math.cos(rad))
+                cx = bx + (ox * cos_r - oy * sin_r)
+                cy = by + (ox * sin_r + oy * cos_r)
 
                 vis_dx = cx - bx
                 vis_dy = cy - by
@@ -1150,6 +1192,7 @@ def _(
     mo,
     re,
     reset_button,
+    sys,
 ):
     from magical_athlete_simulator.simulation.telemetry import (
         SnapshotPolicy,
@@ -1168,8 +1211,26 @@ def _(
     get_use_scripted_dice()
     get_dice_rolls_text()
 
+    class LineCountingStdout:
+        """Forwards console output to stdout, counting the lines written."""
+
+        def __init__(self):
+            self.lines = 0
+
+        def write(self, text: str) -> int:
+            self.lines += text.count("\n")
+            return sys.stdout.write(text)
+
+        def flush(self) -> None:
+            sys.stdout.flush()
+
+    log_output = LineCountingStdout()
     log_console = Console(
-        record=True, width=120, force_terminal=True, color_system="truecolor"
+        file=log_output,
+        record=True,
+        width=120,
+        force_terminal=True,
+        color_system="truecolor",
     )
     root_logger = logging.getLogger()
     for h in root_logger.handlers[:]:
@@ -1212,11 +1273,22 @@ def _(
     SNAPSHOT_EVENTS = (MoveCmdEvent, WarpCmdEvent, TripCmdEvent)
 
     class RichLogSource:
-        def __init__(self, console):
+        def __init__(self, console, output):
             self._console = console
+            # Wrapped lines count too, so this matches the exported log
+            self._output = output
+            self._generation = 0
+
+        def clear(self) -> None:
+            self._console.export_html(clear=True)
+            self._generation += 1
+            self._output.lines = 0
+
+        def line_count(self) -> int:
+            return self._output.lines
 
-        def export_text(self) -> str:
-            return self._console.export_text(clear=False)
+        def html_snapshot_id(self) -> int:
+            return (self._generation << 32) | self._output.lines
 
         def export_html(self) -> str:
             return self._console.export_html(
@@ -1230,13 +1302,14 @@ def _(
         snapshot_on_turn_end=False,
     )
 
+    log_source = RichLogSource(log_console, log_output)
     snapshot_recorder = SnapshotRecorder(
         policy=policy,
-        log_source=RichLogSource(log_console),
+        log_source=log_source,
     )
 
     # --- CHANGED BLOCK START ---
-    metrics_aggregator = MetricsAggregator(config_hash="interactive-session")
+    metrics_aggregator = MetricsAggregator(config_hash=b"interactive-session")
     metrics_aggregator.initialize_racers(scenario.engine)
 
     # FIX 1: Start the counter at 1.
@@ -1256,10 +1329,11 @@ def _(
 
     # FIX 2: Capture Initial State as Turn 0
     snapshot_recorder.capture(engine, "InitialState", turn_index=0)
+    snapshot_recorder.flush_log_html()
 
     with mo.status.spinner(title="Simulating..."):
         while not engine.state.race_over:
-            log_console.export_html(clear=True)
+            log_source.clear()
             t_idx = sim_turn_counter["current"]
 
             actual_racer_idx = engine.state.current_racer_idx
@@ -1292,11 +1366,12 @@ def _(
 
     step_history: list[StepSnapshot] = snapshot_recorder.step_history
     turn_map = snapshot_recorder.turn_map
+    get_log_html = snapshot_recorder.log_html
 
     info_md = mo.md(
         f"✅ **Simulation complete!** {len(current_roster)} racers, {sim_turn_counter['current'] - 1} turns"
     )
-    return info_md, step_history, turn_map
+    return get_log_html, info_md, step_history, turn_map
 
 
 @app.cell
@@ -1426,7 +1501,15 @@ def _(
 
 
 @app.cell
-def _(BG_COLOR, current_data, current_turn_idx, mo, step_history, turn_map):
+def _(
+    BG_COLOR,
+    current_data,
+    current_turn_idx,
+    get_log_html,
+    mo,
+    step_history,
+    turn_map,
+):
     # --- LOG VIEWER ---
     if not current_data:
         log_ui = mo.md("No logs")
@@ -1440,7 +1523,7 @@ def _(BG_COLOR, current_data, current_turn_idx, mo, step_history, turn_map):
                 continue
             is_active = t == current_turn_idx
             end_of_turn_idx = turn_map[t][-1]
-            full_turn_log = step_history[end_of_turn_idx].log_html
+            full_turn_log = get_log_html(step_history[end_of_turn_idx])
 
             if is_active:
                 bg, border, opacity = "#000000", "#00FF00", "1.0"
@@ -1479,8 +1562,6 @@ def _(BG_COLOR, current_data, current_turn_idx, mo, step_history, turn_map):
 
 @app.cell
 def _(
-    BOARD_DEFINITIONS,
-    board_positions,
     current_data,
     get_board,
     log_ui,
@@ -1492,15 +1573,8 @@ def _(
     if not current_data:
         layout = mo.md("Waiting for simulation...")
     else:
-        factory = BOARD_DEFINITIONS.get(get_board())
-        if not factory:
-            factory = BOARD_DEFINITIONS["standard"]
-        board_instance = factory()
-
         # 3. Render
-        track_svg = mo.Html(
-            render_game_track(current_data, board_positions, board=board_instance)
-        )
+        track_svg = mo.Html(render_game_track(current_data, get_board()))
         layout = mo.hstack(
             [mo.vstack([nav_ui, track_svg], align="center"), log_ui],
             gap=2,
@@ -1515,21 +1589,21 @@ def _():
     from magical_athlete_simulator.core.registry import RACER_ABILITIES
     from magical_athlete_simulator.racers import get_ability_classes
     from magical_athlete_simulator.core.agent import (
-        BooleanInteractive,
-        SelectionInteractive,
+        BooleanDecisionMixin,
+        SelectionDecisionMixin,
     )
 
     ability_classes = get_ability_classes()
 
     # Filter: Keep racer if NONE of their abilities are interactive
-    # This checks if the racer class implements the interactive protocols
+    # This checks if the ability class uses one of the decision mixins
     automatic_racers_list = [
         racer
         for racer, abilities in RACER_ABILITIES.items()
         if not any(
             issubclass(
                 ability_classes.get(a),
-                (BooleanInteractive, SelectionInteractive),
+                (BooleanDecisionMixin, SelectionDecisionMixin),
             )
             for a in abilities
             if ability_classes.get(a)
@@ -1,26 +1,97 @@
 from __future__ import annotations  # noqa: INP001
 
 import argparse
+import logging
+import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, repeat
 from typing import TYPE_CHECKING
 
-from magical_athlete_simulator.core.state import (
-    GameRules,
-    GameState,
-    LogContext,
-    RacerState,
-)
-from magical_athlete_simulator.engine import ENGINE_ID_COUNTER
-from magical_athlete_simulator.engine.board import BOARD_DEFINITIONS
-from magical_athlete_simulator.engine.game_engine import GameEngine
-from magical_athlete_simulator.simulation.hashing import GameConfiguration
-
 if TYPE_CHECKING:
-    from magical_athlete_simulator.core.types import RacerName
+    from magical_athlete_simulator.core.types import BoardName, RacerName
+    from magical_athlete_simulator.simulation.runner import SimulationResult
 
+RACES_PER_TASK = 16
+MAX_TURNS = 500
+
+
+def _silence_engine_logs() -> None:
+    logging.getLogger("magical_athlete").setLevel(logging.CRITICAL)
+
+
+def run_many(
+    roster: list[RacerName],
+    board_name: BoardName,
+    n: int,
+    base_seed: int = 0,
+    *,
+    workers: int | None = None,
+) -> list[SimulationResult]:
+    """Run `n` races of one roster with seeds base_seed..base_seed+n-1 across processes."""
+    # Deferred like main()'s engine imports
+    from magical_athlete_simulator.simulation.hashing import GameConfiguration  # noqa: PLC0415
+    from magical_athlete_simulator.simulation.runner import run_simulation_batch  # noqa: PLC0415
+
+    configs = [
+        GameConfiguration(racers=tuple(roster), board=board_name, seed=seed)
+        for seed in range(base_seed, base_seed + n)
+    ]
+    _silence_engine_logs()
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        initializer=_silence_engine_logs,
+    ) as executor:
+        batches = executor.map(
+            run_simulation_batch,
+            batched(configs, RACES_PER_TASK),
+            repeat(MAX_TURNS),
+        )
+        return [result for batch in batches for result in batch]
+
+
+def print_summary(roster: list[RacerName], results: list[SimulationResult]) -> None:
+    wins = dict.fromkeys(roster, 0)
+    vp_totals = dict.fromkeys(roster, 0)
+    aborted = 0
+    for result in results:
+        # Same rule as the CLI: only turn-limit races lack usable metrics
+        if result.error_code == "MAX_TURNS_REACHED":
+            aborted += 1
+            continue
+        metrics = result.metrics
+        for name, vp, finish in zip(
+            metrics["racer_name"],
+            metrics["final_vp"],
+            metrics["finish_position"],
+            strict=True,
+        ):
+            vp_totals[name] += vp
+            if finish == 1:
+                wins[name] += 1
+
+    completed = len(results) - aborted
+    print(f"🏁 {len(results)} races ({aborted} aborted)")
+    for name in sorted(roster, key=lambda r: wins[r], reverse=True):
+        win_rate = wins[name] / completed if completed else 0.0
+        avg_vp = vp_totals[name] / completed if completed else 0.0
+        print(f"  {name:<12} wins {win_rate:6.1%}  avg VP {avg_vp:5.2f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    # Engine imports are deferred so `--help` and importing this script stay cheap
+    from magical_athlete_simulator.core.state import (  # noqa: PLC0415
+        GameRules,
+        GameState,
+        LogContext,
+        RacerState,
+    )
+    from magical_athlete_simulator.engine import ENGINE_ID_COUNTER  # noqa: PLC0415
+    from magical_athlete_simulator.engine.board import BOARD_DEFINITIONS  # noqa: PLC0415
+    from magical_athlete_simulator.engine.game_engine import GameEngine  # noqa: PLC0415
+    from magical_athlete_simulator.simulation.hashing import GameConfiguration  # noqa: PLC0415
 
-if __name__ == "__main__":
     # 1. Parse CLI Arguments
     parser = argparse.ArgumentParser(description="Run a single Magical Athlete game simulation.")
     parser.add_argument(
@@ -29,7 +100,14 @@ if __name__ == "__main__":
         type=str, 
         help="Base64 encoded configuration string (overrides manual defaults)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--runs",
+        "-n",
+        type=int,
+        default=1,
+        help="Run this many races (seeds counting up from the config seed) in parallel and print a summary",
+    )
+    args = parser.parse_args(argv)
 
     # 2. Determine Settings (CLI vs Default)
     if args.config:
@@ -52,10 +130,14 @@ if __name__ == "__main__":
             "Magician",
             "Scoocher",
         ]
-        board_name = "wild_wilds"
+        board_name: BoardName = "wild_wilds"
         seed = 9
         print(f"Using default config: {roster} on {board_name} (Seed: {seed})")
 
+    if args.runs > 1:
+        print_summary(roster, run_many(roster, board_name, args.runs, seed))
+        return
+
     # 3. Initialize Game
     racers = [RacerState(i, n) for i, n in enumerate(roster)]
     engine_id = next(ENGINE_ID_COUNTER)
@@ -75,3 +157,7 @@ if __name__ == "__main__":
     )
 
     eng.run_race()
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ class SandboxEngine:
 
         # Make sure serial is safe if sandbox pushes new events
         eng.state.serial = max(
-            (se.serial for se in eng.state.queue),
+            (se.serial for _, se in eng.state.queue),
             default=eng.state.serial,
         )
 
@@ -44,7 +44,7 @@ class SandboxEngine:
     @staticmethod
     def _rebuild_subscribers_via_update_abilities(eng: GameEngine) -> None:
         # Clear whatever was there (fresh engine usually has empty subscribers anyway)
-        eng.subscribers.clear()
+        eng.clear_subscribers()
 
         for racer in eng.state.racers:
             idx = racer.idx
@@ -69,21 +69,19 @@ class SandboxEngine:
         eng.state.current_racer_idx = racer_idx
 
         # Snapshot BEFORE
-        before_vp = [r.victory_points for r in eng.state.racers]
-        before_pos = [r.position for r in eng.state.racers]
+        racers = eng.state.racers
+        before_vp = [r.victory_points for r in racers]
+        before_pos = [r.position for r in racers]
 
         # Run exactly one turn using the engine's normal logic
         eng.run_turn()
 
-        # Snapshot AFTER
-        after_vp = [r.victory_points for r in eng.state.racers]
-        after_pos = [r.position for r in eng.state.racers]
-        tripped = [r.tripped for r in eng.state.racers]
-
-        # If you track eliminated explicitly, keep it; otherwise default to False.
-        eliminated = [getattr(r, "eliminated", False) for r in eng.state.racers]
-
-        vp_delta = [a - b for a, b in zip(after_vp, before_vp, strict=False)]
+        # Snapshot AFTER, one pass over the racers
+        after = [
+            (r.victory_points - vp, r.position, r.tripped, r.eliminated)
+            for r, vp in zip(eng.state.racers, before_vp, strict=True)
+        ]
+        vp_delta, after_pos, tripped, eliminated = map(list, zip(*after, strict=True))
 
         return TurnOutcome(
             vp_delta=vp_delta,
@@ -1,32 +1,58 @@
 """Command-line interface for batch simulations."""
 
 import logging
+import multiprocessing
+import os
 import sys
 from collections.abc import Iterable
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
+from itertools import batched
 from pathlib import Path
 
 import cappa
 from tqdm import tqdm
 
 from magical_athlete_simulator.simulation.combinations import (
+    GenerationStats,
     compute_total_runs,
     generate_combinations,
 )
 from magical_athlete_simulator.simulation.config import SimulationConfig
 from magical_athlete_simulator.simulation.db.manager import SimulationDatabase
-from magical_athlete_simulator.simulation.db.models import Race
-from magical_athlete_simulator.simulation.runner import run_single_simulation
+from magical_athlete_simulator.simulation.db.models import INTERNED_NAMES, Race
+from magical_athlete_simulator.simulation.hashing import (
+    GameConfiguration,
+    config_fingerprint,
+)
+from magical_athlete_simulator.simulation.runner import (
+    SimulationResult,
+    run_simulation_batch,
+)
 
 logging.getLogger("magical_athlete").setLevel(logging.CRITICAL)
 
 BATCH_SIZE = 1000
+# Export DuckDB to Parquet after this many inserted batches (and on exit)
+FLUSH_EVERY_BATCHES = 10
+# Races run back to back inside one process-pool task
+RACES_PER_TASK = 16
+# Tasks submitted to the process pool per worker before we wait for results
+IN_FLIGHT_PER_WORKER = 4
+# Buffered per-race console lines are written once per this many lines
+LOG_FLUSH_LINES = 100
 RESULTS_DIR = Path("results")
 
 
 def delete_existing_results(
     dir_path: Path,
-    patterns: Iterable[str] = ("*.parquet", "*.duckdb"),
+    patterns: Iterable[str] = ("*.parquet", "*/part-*.parquet", "*.duckdb"),
 ) -> None:
     """Delete files matching patterns in dir_path (non-recursive)."""
     if not dir_path.exists():
@@ -41,6 +67,51 @@ def delete_existing_results(
     tqdm.write(f"🧹 Deleted {deleted} files from {dir_path}")
 
 
+def _init_worker() -> None:
+    """Silence engine logging in pool workers, same as in the main process."""
+    logging.getLogger("magical_athlete").setLevel(logging.CRITICAL)
+
+
+def _start_method() -> str:
+    """Prefer a fork server for pool workers; it is unavailable on Windows."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+def _build_race_record(
+    game_config: GameConfiguration,
+    result: SimulationResult,
+) -> Race:
+    """Assign podium ranks to the racer metrics and build the race row."""
+    metrics = result.metrics
+    vps = metrics["final_vp"]
+    turns = metrics["turns_taken"]
+    standings = sorted(
+        range(len(vps)),
+        key=lambda i: (vps[i], -turns[i]),
+        reverse=True,
+    )
+    ranks = metrics["rank"]
+    for rank, i in enumerate(standings[:2], start=1):
+        if vps[i] > 0:
+            ranks[i] = rank
+    metrics["racer_name"] = [INTERNED_NAMES[n] for n in metrics["racer_name"]]
+
+    return Race(
+        config_hash=result.config_hash,
+        config_encoded=game_config.encoded,
+        seed=game_config.seed,
+        board=INTERNED_NAMES[game_config.board],
+        racer_names=[INTERNED_NAMES[n] for n in game_config.racers],
+        racer_count=len(game_config.racers),
+        timestamp=result.timestamp,
+        execution_time_ms=result.execution_time_ms,
+        error_code=result.error_code,
+        total_turns=result.turn_count,
+    )
+
+
 @dataclass
 class Args:
     """CLI arguments for simulation runner."""
@@ -50,6 +121,8 @@ class Args:
     max_total_runs: int | None = 100_000
     max_turns: int = 500
     seed_offset: int = 0
+    workers: int | None = None  # Simulation processes (default: all CPU cores)
+    verbose: bool = False  # Print a start/finish line for every race
 
     def __call__(self) -> int:
         if not self.config.exists():
@@ -95,6 +168,17 @@ class Args:
         tqdm.write(f"Max total runs: {max_total or 'unlimited'}")
         tqdm.write("")
 
+        db = SimulationDatabase(RESULTS_DIR)
+        seen_hashes = {config_fingerprint(h) for h in db.get_known_hashes()}
+        initial_seen_count = len(seen_hashes)
+        # Inserts and Parquet flushes happen on the DB writer thread
+        db.start_writer(
+            batch_size=BATCH_SIZE,
+            flush_every_batches=FLUSH_EVERY_BATCHES,
+        )
+
+        # Known configs are skipped inside the generator, before they reach us
+        gen_stats = GenerationStats()
         combo_gen = generate_combinations(
             eligible_racers=eligible_racers,
             racer_counts=config.racer_counts,
@@ -103,16 +187,39 @@ class Args:
             max_total_runs=max_total,
             seed_offset=self.seed_offset,
             filters=config.filters,
+            seen=seen_hashes,
+            stats=gen_stats,
         )
 
-        db = SimulationDatabase(RESULTS_DIR)
-        seen_hashes = db.get_known_hashes()
-        initial_seen_count = len(seen_hashes)
-
         completed = 0
-        skipped = 0
         aborted = 0
-        unsaved_changes = 0
+
+        # Console output is batched into few large writes instead of one per line
+        log_buffer: list[str] = []
+
+        def flush_log() -> None:
+            if log_buffer:
+                tqdm.write("\n".join(log_buffer))
+                log_buffer.clear()
+
+        def record_result(
+            game_config: GameConfiguration,
+            result: SimulationResult,
+        ) -> None:
+            nonlocal completed, aborted
+            log_buffer.extend(result.log_lines)
+            if len(log_buffer) >= LOG_FLUSH_LINES:
+                flush_log()
+
+            if result.error_code == "MAX_TURNS_REACHED":
+                aborted += 1
+            else:
+                completed += 1
+                db.submit(
+                    _build_race_record(game_config, result),
+                    result.metrics,
+                    result.position_logs,
+                )
 
         total_expected = compute_total_runs(
             eligible_racers=eligible_racers,
@@ -122,90 +229,93 @@ class Args:
             max_total_runs=max_total,
         )
 
+        workers = self.workers or os.cpu_count() or 1
+        max_in_flight = workers * IN_FLIGHT_PER_WORKER
+
+        run_succeeded = False
         try:
-            with tqdm(
-                desc="Simulating",
-                unit="race",
-                total=total_expected,
-                dynamic_ncols=True,
-            ) as pbar:
-                for game_config in combo_gen:
-                    try:
-                        config_hash = game_config.compute_hash()
-
-                        if config_hash in seen_hashes:
-                            skipped += 1
-                            continue  # This triggers the finally block update
-
-                        seen_hashes.add(config_hash)
-
-                        result = run_single_simulation(game_config, max_turns)
-
-                        if result.error_code == "MAX_TURNS_REACHED":
-                            aborted += 1
-                        else:
-                            completed += 1
-                            unsaved_changes += 1
-
-                            # --- Ranking Logic ---
-                            standings = sorted(
-                                result.metrics,
-                                key=lambda m: (m.final_vp, -m.turns_taken),
-                                reverse=True,
-                            )
-                            rank_map: dict[int, int] = {}
-                            if len(standings) > 0 and standings[0].final_vp > 0:
-                                rank_map[standings[0].racer_id] = 1
-                            if len(standings) > 1 and standings[1].final_vp > 0:
-                                rank_map[standings[1].racer_id] = 2
-
-                            for m in result.metrics:
-                                m.rank = rank_map.get(m.racer_id)
-
-                            race_record = Race(
-                                config_hash=result.config_hash,
-                                config_encoded=game_config.encoded,
-                                seed=game_config.seed,
-                                board=game_config.board,
-                                racer_names=list(game_config.racers),
-                                racer_count=len(game_config.racers),
-                                timestamp=result.timestamp,
-                                execution_time_ms=result.execution_time_ms,
-                                error_code=result.error_code,
-                                total_turns=result.turn_count,
-                            )
-
-                            # Changed: Pass position_logs to save_simulation
-                            db.save_simulation(
-                                race_record,
-                                result.metrics,
-                                result.position_logs,
-                            )
-
-                        if unsaved_changes >= BATCH_SIZE:
-                            tqdm.write(
-                                f"💾 Flushing {unsaved_changes} records to disk...",
-                            )
-                            db.flush_to_parquet()
-                            unsaved_changes = 0
-
-                    finally:
-                        # Ensures progress bar moves even if we continue/skip
-                        pbar.update(1)
+            # Simulations run in worker processes; dedup, ranking and all DB
+            # writes stay on the main process (the latter on its writer thread).
+            # That thread and DuckDB's own make forking this process unsafe, so
+            # workers are started from a clean fork server (or spawned) instead.
+            with (
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(_start_method()),
+                    initializer=_init_worker,
+                ) as executor,
+                tqdm(
+                    desc="Simulating",
+                    unit="race",
+                    total=total_expected,
+                    dynamic_ncols=True,
+                    mininterval=0.5,
+                    smoothing=0.1,
+                    # No redraws at all when piped / in CI
+                    disable=not sys.stderr.isatty(),
+                ) as pbar,
+            ):
+                in_flight: dict[
+                    Future[list[SimulationResult]],
+                    tuple[GameConfiguration, ...],
+                ] = {}
+
+                def collect(return_when: str) -> None:
+                    done, _ = wait(in_flight, return_when=return_when)
+                    finished = 0
+                    for future in done:
+                        chunk = in_flight.pop(future)
+                        for game_config, result in zip(
+                            chunk,
+                            future.result(),
+                            strict=True,
+                        ):
+                            record_result(game_config, result)
+                        finished += len(chunk)
+                    pbar.update(finished)
+                    # Inline status instead of per-race console lines
+                    pbar.set_postfix_str(
+                        f"✅ {completed} ⏭️ {gen_stats.skipped_seen} 🛑 {aborted}",
+                        refresh=False,
+                    )
+
+                reported_skips = 0
+                for chunk in batched(combo_gen, RACES_PER_TASK):
+                    # Skipped configs still count towards the expected total
+                    if gen_stats.skipped_seen > reported_skips:
+                        pbar.update(gen_stats.skipped_seen - reported_skips)
+                        reported_skips = gen_stats.skipped_seen
+
+                    future = executor.submit(
+                        run_simulation_batch,
+                        chunk,
+                        max_turns,
+                        verbose=self.verbose,
+                    )
+                    in_flight[future] = chunk
+
+                    # Bounded window: the generator is never drained into memory
+                    if len(in_flight) >= max_in_flight:
+                        collect(FIRST_COMPLETED)
+
+                collect(ALL_COMPLETED)
+                pbar.update(gen_stats.skipped_seen - reported_skips)
+            run_succeeded = True
 
         finally:
-            if unsaved_changes > 0:
-                tqdm.write(
-                    f"💾 Flushing {unsaved_changes} remaining records to disk...",
-                )
-                db.flush_to_parquet()
+            flush_log()
+            writer_error: RuntimeError | None = None
+            try:
+                db.close()
+            except RuntimeError as e:
+                writer_error = e
 
             # Restore the nice summary
             summary = f"""
 🏁 Simulation Batch Completed 🏁
 ──────────────────────────────
 ✅ Completed:       {completed}
-⏭️  Skipped:         {skipped}
+⏭️  Skipped:         {gen_stats.skipped_seen}
 🛑 Aborted:         {aborted}
 🆕 Unique Processed: {len(seen_hashes) - initial_seen_count}
 📦 Total DB Size:    {len(seen_hashes)} races
@@ -213,6 +323,12 @@ class Args:
             """
             tqdm.write(summary)
 
+            if writer_error is not None:
+                # Never mask the error (or Ctrl-C) already unwinding the run
+                if run_succeeded:
+                    raise writer_error
+                tqdm.write(f"⚠️ {writer_error}: {writer_error.__cause__!r}")
+
         return 0
 
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, Self, override, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, Self, override
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -11,19 +11,21 @@ if TYPE_CHECKING:
     from magical_athlete_simulator.engine.game_engine import GameEngine
 
 
-@dataclass
+# Built for every agent decision, so keep them light: no per-instance __dict__
+@dataclass(slots=True)
 class DecisionContext[T]:
     source: T
     game_state: GameState
     source_racer_idx: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionDecisionContext[T, R](DecisionContext[T]):
     options: Sequence[R]
 
 
-@runtime_checkable
+# Not @runtime_checkable: structural isinstance checks are slow. At runtime,
+# check nominally against BooleanDecisionMixin / SelectionDecisionMixin instead.
 class BooleanInteractive(Protocol):
     def get_auto_boolean_decision(
         self,
@@ -32,7 +34,6 @@ class BooleanInteractive(Protocol):
     ) -> bool: ...
 
 
-@runtime_checkable
 class SelectionInteractive[R](Protocol):
     def get_auto_selection_decision(
         self,
@@ -32,78 +32,91 @@ EventTriggerMode = Literal[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameEvent(ABC):
     responsible_racer_idx: int | None
     source: Source
     phase: Phase
 
 
-@dataclass(frozen=True)
+# The mixins are slot-less markers that only declare their attribute: two
+# slotted bases with fields can't be combined, so the price is that every
+# event has to redeclare the mixin field itself.
 class EmitsAbilityTriggeredEvent:
     """Mixin for events that emit an AbilityTriggeredEvent"""
 
-    emit_ability_triggered: EventTriggerMode
+    __slots__: tuple[()] = ()
+
+    # Declared only: each slotted event provides the actual field
+    emit_ability_triggered: EventTriggerMode  # pyright: ignore[reportUninitializedInstanceVariable]
 
 
-@dataclass(frozen=True)
 class HasTargetRacer:
     """Mixin for events that have a racer as a target"""
 
-    target_racer_idx: int
+    __slots__: tuple[()] = ()
+
+    # Declared only: each slotted event provides the actual field
+    target_racer_idx: int  # pyright: ignore[reportUninitializedInstanceVariable]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RacerFinishedEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     finishing_position: int  # 1st, 2nd, etc.
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TurnStartEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     phase: Phase = Phase.SYSTEM
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PerformMainRollEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     phase: Phase = Phase.ROLL_DICE
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RollModificationWindowEvent(GameEvent, HasTargetRacer):
     """
     Fired after a roll is calculated but before it is finalized.
     Listeners can inspect `engine.state.roll_state` and call `engine.trigger_reroll()`.
     """
 
+    target_racer_idx: int
     current_roll_val: int
     roll_serial: int
     phase: Phase = Phase.ROLL_WINDOW
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RollResultEvent(GameEvent, HasTargetRacer):
     """
     Fired exactly once per valid main roll, containing the final locked-in values.
     """
 
+    target_racer_idx: int
     base_value: int
     final_value: int
     phase: Phase = Phase.MAIN_ACT
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ResolveMainMoveEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     roll_serial: int
     phase: Phase = Phase.MAIN_ACT
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MainMoveSkippedEvent(GameEvent):
     responsible_racer_idx: int
     phase: Phase = Phase.ROLL_DICE
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PassingEvent(GameEvent):
     responsible_racer_idx: Annotated[int, "The ID of the racer that is passing"]
     target_racer_idx: Annotated[int, "The ID of the racer that is being passed."]
@@ -119,13 +132,14 @@ class PassingEvent(GameEvent):
         return self.target_racer_idx
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MoveCmdEvent(GameEvent, EmitsAbilityTriggeredEvent, HasTargetRacer):
+    target_racer_idx: int
     distance: int
     emit_ability_triggered: EventTriggerMode = "never"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SimultaneousMoveCmdEvent(GameEvent, EmitsAbilityTriggeredEvent):
     """
     Atomically moves multiple racers.
@@ -135,52 +149,60 @@ class SimultaneousMoveCmdEvent(GameEvent, EmitsAbilityTriggeredEvent):
     emit_ability_triggered: EventTriggerMode = "never"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class WarpCmdEvent(GameEvent, EmitsAbilityTriggeredEvent, HasTargetRacer):
+    target_racer_idx: int
     target_tile: int
     emit_ability_triggered: EventTriggerMode = "never"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SimultaneousWarpCmdEvent(GameEvent, EmitsAbilityTriggeredEvent):
     warps: Sequence[tuple[int, int]]  # (racer_idx, target_tile)
     emit_ability_triggered: EventTriggerMode = "never"
 
 
-@dataclass(frozen=True)
-class TripCmdEvent(GameEvent, EmitsAbilityTriggeredEvent, HasTargetRacer): ...
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TripCmdEvent(GameEvent, EmitsAbilityTriggeredEvent, HasTargetRacer):
+    target_racer_idx: int
+    emit_ability_triggered: EventTriggerMode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TripRecoveryEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     phase: Phase = Phase.PRE_MAIN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PreMoveEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     start_tile: int
     distance: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PreWarpEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     start_tile: int
     target_tile: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PostMoveEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     start_tile: int
     end_tile: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PostWarpEvent(GameEvent, HasTargetRacer):
+    target_racer_idx: int
     start_tile: int
     end_tile: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AbilityTriggeredEvent(GameEvent):
     responsible_racer_idx: int
     source: AbilityName | ModifierName
@@ -207,7 +229,7 @@ class AbilityTriggeredEvent(GameEvent):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveDistanceQuery:
     racer_idx: int
     base_amount: int
@@ -227,9 +249,9 @@ class ScheduledEvent:
     event: GameEvent
     mode: TimingMode = "FLAT"
 
-    @cached_property
-    def sort_key(self):
-        """Calculates the comparison tuple once per instance."""
+    @property
+    def sort_key(self) -> tuple[Phase, int, int, int]:
+        """The heap comparison tuple; read once, when the event is queued."""
         if self.mode == "FLAT":
             # Ignore depth
             return (self.event.phase, 0, self.priority, self.serial)
@@ -245,9 +267,20 @@ class ScheduledEvent:
 
         return (self.event.phase, 0, self.priority, self.serial)
 
-    def __lt__(self, other: Self) -> bool:
-        # Extremely fast comparison of pre-calculated tuples
-        return self.sort_key < other.sort_key
+    @cached_property
+    def state_key(self) -> int:
+        """
+        Semantic identity for GameState.get_state_hash (events are frozen).
+
+        Kept as the hash of (phase, priority, repr) so the per-event queue
+        snapshot sorts and hashes plain ints.
+        """
+        return hash((self.event.phase, self.priority, repr(self.event)))
+
+
+# Heap entries pair the sort key with its event so heapq compares plain tuples
+# in C; serials are unique, so the comparison never reaches the event itself
+QueueEntry = tuple[tuple[Phase, int, int, int], ScheduledEvent]
 
 
 AbilityTriggeredEventOrSkipped = Literal["skip_trigger"] | AbilityTriggeredEvent
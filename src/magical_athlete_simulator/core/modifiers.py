@@ -19,12 +19,15 @@ class Modifier(ABC):
     def display_name(self) -> str:  # instance-level, can be dynamic
         return self.name
 
-    # Equality check for safe add/remove
+    # Equality check for safe add/remove.
+    # Cheapest checks first: identity, then the int owner id.
     @override
     def __eq__(self, other: object):
+        if other is self:
+            return True
         if not isinstance(other, Modifier):
             return NotImplemented
-        return self.name == other.name and self.owner_idx == other.owner_idx
+        return self.owner_idx == other.owner_idx and self.name == other.name
 
     @override
     def __hash__(self):
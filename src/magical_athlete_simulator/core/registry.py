@@ -5,27 +5,28 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from magical_athlete_simulator.core.types import AbilityName, RacerName
 
-RACER_ABILITIES: dict[RacerName, set[AbilityName]] = {
-    "BabaYaga": {"BabaYagaTrip"},
-    "Banana": {"BananaTrip"},
-    "Blimp": {"BlimpModifierManager"},
-    "Centaur": {"CentaurTrample"},
-    "Coach": {"CoachAura"},
-    "Copycat": {"CopyLead"},
-    "FlipFlop": {"FlipFlopSwap"},
-    "Gunk": {"GunkSlime"},
-    "Hare": {"HareHubris"},
-    "HugeBaby": {"HugeBabyPush"},
-    "Magician": {"MagicalReroll"},
-    "PartyAnimal": {"PartyPull", "PartyBoost"},
-    "Romantic": {"RomanticMove"},
-    "Scoocher": {"ScoochStep"},
-    "Skipper": {"SkipperTurn"},
-    "Genius": {"GeniusPrediction"},
-    "Suckerfish": {"SuckerfishRide"},
-    "LovableLoser": {"LovableLoserBonus"},
-    "Mastermind": {"MastermindPredict"},
-    "Leaptoad": {"LeaptoadJumpManager"},
-    "Stickler": {"SticklerStrictFinishManager"},
-    "Sisyphus": {"SisyphusCurse"},
+# Read-only lookup table; callers copy before mutating
+RACER_ABILITIES: dict[RacerName, frozenset[AbilityName]] = {
+    "BabaYaga": frozenset({"BabaYagaTrip"}),
+    "Banana": frozenset({"BananaTrip"}),
+    "Blimp": frozenset({"BlimpModifierManager"}),
+    "Centaur": frozenset({"CentaurTrample"}),
+    "Coach": frozenset({"CoachAura"}),
+    "Copycat": frozenset({"CopyLead"}),
+    "FlipFlop": frozenset({"FlipFlopSwap"}),
+    "Gunk": frozenset({"GunkSlime"}),
+    "Hare": frozenset({"HareHubris"}),
+    "HugeBaby": frozenset({"HugeBabyPush"}),
+    "Magician": frozenset({"MagicalReroll"}),
+    "PartyAnimal": frozenset({"PartyPull", "PartyBoost"}),
+    "Romantic": frozenset({"RomanticMove"}),
+    "Scoocher": frozenset({"ScoochStep"}),
+    "Skipper": frozenset({"SkipperTurn"}),
+    "Genius": frozenset({"GeniusPrediction"}),
+    "Suckerfish": frozenset({"SuckerfishRide"}),
+    "LovableLoser": frozenset({"LovableLoserBonus"}),
+    "Mastermind": frozenset({"MastermindPredict"}),
+    "Leaptoad": frozenset({"LeaptoadJumpManager"}),
+    "Stickler": frozenset({"SticklerStrictFinishManager"}),
+    "Sisyphus": frozenset({"SisyphusCurse"}),
 }
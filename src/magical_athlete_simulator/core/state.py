@@ -5,9 +5,13 @@ from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from magical_athlete_simulator.core.abilities import Ability
-    from magical_athlete_simulator.core.events import ScheduledEvent
+    from magical_athlete_simulator.core.events import QueueEntry
     from magical_athlete_simulator.core.modifiers import RacerModifier
-    from magical_athlete_simulator.core.types import AbilityName, RacerName
+    from magical_athlete_simulator.core.types import (
+        AbilityName,
+        ModifierName,
+        RacerName,
+    )
     from magical_athlete_simulator.engine.board import Board
 
 TimingMode = Literal["FLAT", "DFS", "BFS"]
@@ -43,22 +47,55 @@ class RacerState:
     modifiers: list[RacerModifier] = field(default_factory=list)
     active_abilities: dict[AbilityName, Ability] = field(default_factory=dict)
 
-    @property
-    def repr(self) -> str:
-        return f"{self.idx}:{self.name}"
+    # "idx:name" label for logs; both parts are fixed, so build it once
+    repr: str = field(init=False, repr=False, compare=False)
+    # Name caches for the state hashes; whoever mutates active_abilities or
+    # modifiers must call the matching invalidate_* method
+    _sorted_abilities: tuple[AbilityName, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _modifier_names: tuple[AbilityName | ModifierName, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.repr = f"{self.idx}:{self.name}"
 
     @property
     def abilities(self) -> set[AbilityName]:
         """Derive from active instances."""
         return set(self.active_abilities.keys())
 
+    def sorted_abilities(self) -> tuple[AbilityName, ...]:
+        if self._sorted_abilities is None:
+            self._sorted_abilities = tuple(sorted(self.active_abilities))
+        return self._sorted_abilities
+
+    def modifier_names(self) -> tuple[AbilityName | ModifierName, ...]:
+        if self._modifier_names is None:
+            self._modifier_names = tuple(m.name for m in self.modifiers)
+        return self._modifier_names
+
+    def invalidate_ability_cache(self) -> None:
+        self._sorted_abilities = None
+
+    def invalidate_modifier_cache(self) -> None:
+        self._modifier_names = None
+
     @property
     def finished(self) -> bool:
         return self.finish_position is not None
 
     @property
     def active(self) -> bool:
-        return not self.finished and not self.eliminated
+        # Checked in every board scan; inlined rather than going via `finished`
+        return self.finish_position is None and not self.eliminated
 
 
 @dataclass(slots=True)
@@ -70,42 +107,50 @@ class GameState:
     next_turn_override: int | None = None
     roll_state: RollState = field(default_factory=RollState)
 
-    queue: list[ScheduledEvent] = field(default_factory=list)
+    queue: list[QueueEntry] = field(default_factory=list)
     serial: int = 0
     race_over: bool = False
     history: set[int] = field(default_factory=set)
 
     def get_state_hash(self) -> int:
-        """Hash entire game state including racers, board, and semantic queue content."""
+        """
+        Hash entire game state including racers, board, and semantic queue content.
+
+        Called once per processed event, so the expensive parts are memoized:
+        each ScheduledEvent hashes its event repr once via `state_key`, and the
+        board rebuilds its modifier snapshot only when modifiers change.
+        """
+        # List comprehensions are inlined (PEP 709) and build the same tuples
+        # faster than tuple() over a generator
         racer_data = tuple(
-            (
-                r.idx,
-                r.position,
-                r.tripped,
-                r.finish_position,
-                r.eliminated,
-                r.victory_points,
-                frozenset(r.abilities),
-                frozenset(m.name for m in r.modifiers),
-            )
-            for r in self.racers
+            [
+                (
+                    r.idx,
+                    r.position,
+                    r.tripped,
+                    r.finish_position,
+                    r.eliminated,
+                    r.victory_points,
+                    # Both name tuples are cached on the racer. Abilities are
+                    # unique dict keys, so their sorted tuple compares like a
+                    # set; modifier names can repeat and keep frozenset semantics
+                    r.sorted_abilities(),
+                    frozenset(r.modifier_names()),
+                )
+                for r in self.racers
+            ],
         )
 
-        board_data = frozenset(
-            (tile, frozenset(m.name for m in mods))
-            for tile, mods in self.board.dynamic_modifiers.items()
-        )
+        board_data = self.board.modifier_state()
 
         roll_data = (self.roll_state.serial_id, self.roll_state.base_value)
 
-        queue_data = tuple(
-            sorted((se.event.phase, se.priority, repr(se.event)) for se in self.queue),
-        )
+        queue_data = tuple(sorted([se.state_key for _, se in self.queue]))
 
         return hash((racer_data, board_data, roll_data, queue_data))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnOutcome:
     """Result of simulating exactly one turn for a specific racer."""
 
@@ -11,12 +11,14 @@ def add_racer_modifier(engine: GameEngine, target_idx: int, modifier: RacerModif
     racer = engine.get_racer(target_idx)
     if modifier not in racer.modifiers:
         racer.modifiers.append(modifier)
-        engine.log_info(f"ENGINE: Added {modifier.name} to {racer.repr}")
+        racer.invalidate_modifier_cache()
+        engine.log_info("ENGINE: Added %s to %s", modifier.name, racer.repr)
 
 
 def remove_racer_modifier(engine: GameEngine, target_idx: int, modifier: RacerModifier):
     racer = engine.get_racer(target_idx)
     if modifier in racer.modifiers:
         racer.modifiers.remove(modifier)
+        racer.invalidate_modifier_cache()
 
-        engine.log_info(f"ENGINE: Removed {modifier.name} from {racer.repr}")
+        engine.log_info("ENGINE: Removed %s from %s", modifier.name, racer.repr)
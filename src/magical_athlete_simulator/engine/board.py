@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     )
     from magical_athlete_simulator.engine.game_engine import GameEngine
 
+    type ModifierState = frozenset[tuple[int, frozenset[AbilityName | ModifierName]]]
+
 
 @dataclass(slots=True)
 class Board:
@@ -29,6 +31,14 @@ class Board:
         init=False,
         default_factory=lambda: defaultdict(list),
     )
+    # Snapshot for GameState.get_state_hash; dropped whenever a dynamic
+    # modifier is registered or unregistered
+    _modifier_state: ModifierState | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def register_modifier(
         self,
@@ -42,8 +52,12 @@ class Board:
         # Because eq=True, this prevents adding a second "identical" blocker
         if modifier not in modifiers:
             modifiers.append(modifier)
+            self._modifier_state = None
             engine.log_info(
-                f"BOARD: Registered {modifier.name} (owner={modifier.owner_idx}) at tile {tile}"
+                "BOARD: Registered %s (owner=%s) at tile %s",
+                modifier.name,
+                modifier.owner_idx,
+                tile,
             )
 
     def unregister_modifier(
@@ -54,18 +68,37 @@ class Board:
         # eq=True makes "in" work even for new instances
         if not modifiers or modifier not in modifiers:
             engine.log_warning(
-                f"BOARD: Failed to unregister {modifier.name} from {tile} - not found."
+                "BOARD: Failed to unregister %s from %s - not found.",
+                modifier.name,
+                tile,
             )
             return
 
         modifiers.remove(modifier)
+        self._modifier_state = None
         engine.log_info(
-            f"BOARD: Unregistered {modifier.name} (owner={modifier.owner_idx}) from tile {tile}"
+            "BOARD: Unregistered %s (owner=%s) from tile %s",
+            modifier.name,
+            modifier.owner_idx,
+            tile,
         )
 
         if not modifiers:
             self.dynamic_modifiers.pop(tile, None)
 
+    def modifier_state(self) -> ModifierState:
+        """Names of the dynamic modifiers per tile, rebuilt only after changes."""
+        if self._modifier_state is None:
+            state: ModifierState = frozenset(
+                [
+                    (tile, frozenset([m.name for m in mods]))
+                    for tile, mods in self.dynamic_modifiers.items()
+                ],
+            )
+            self._modifier_state = state
+            return state
+        return self._modifier_state
+
     def get_modifiers_at(self, tile: int) -> list[SpaceModifier]:
         static = self.static_features.get(tile, ())
         dynamic = self.dynamic_modifiers.get(tile, ())
@@ -144,7 +177,7 @@ class Board:
             if mods:
                 # Format each modifier as "Name(owner=ID)"
                 mod_strs = [f"{m.name}(owner={m.owner_idx})" for m in mods]
-                engine.log_info(f"  Tile {tile:02d}: {', '.join(mod_strs)}")
+                engine.log_info("  Tile %02d: %s", tile, ", ".join(mod_strs))
         engine.log_info("========================")
 
 
@@ -176,7 +209,10 @@ class MoveDeltaTile(SpaceModifier, LandingHookMixin):
             racer_idx,
         )  # uses existing GameEngine API.[file:1]
         engine.log_info(
-            f"{self.display_name}: Queuing {self.delta} move for {racer.repr}",
+            "%s: Queuing %s move for %s",
+            self.display_name,
+            self.delta,
+            racer.repr,
         )
         # New move is a separate event, not part of the original main move.[file:1]
         push_move(
@@ -209,7 +245,7 @@ class TripTile(SpaceModifier, LandingHookMixin):
         if racer.tripped:
             return
         racer.tripped = True
-        engine.log_info(f"{self.name}: {racer.repr} is now Tripped.")
+        engine.log_info("%s: %s is now Tripped.", self.name, racer.repr)
 
 
 @dataclass
@@ -237,7 +273,11 @@ class VictoryPointTile(SpaceModifier, LandingHookMixin):
         racer = engine.get_racer(racer_idx)
         racer.victory_points += self.amount
         engine.log_info(
-            f"{self.display_name}: {racer.repr} gains +{self.amount} VP (now {racer.victory_points}).",
+            "%s: %s gains +%s VP (now %s).",
+            self.display_name,
+            racer.repr,
+            self.amount,
+            racer.victory_points,
         )
 
 
@@ -22,7 +22,11 @@ def log_final_standings(engine: GameEngine):
         else:
             status = "Eliminated"
         engine.log_info(
-            f"Result: {racer.repr} pos={racer.position} vp={racer.victory_points} {status}",
+            "Result: %s pos=%s vp=%s %s",
+            racer.repr,
+            racer.position,
+            racer.victory_points,
+            status,
         )
 
 
@@ -74,7 +78,10 @@ def mark_finished(
         racer.victory_points += rewards[rank - 1]
 
     engine.log_info(
-        f"!!! {racer.repr} FINISHED rank {rank} ({racer.victory_points} VP) !!!",
+        "!!! %s FINISHED rank %s (%s VP) !!!",
+        racer.repr,
+        rank,
+        racer.victory_points,
     )
 
     # Emit event (important for listeners)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import heapq
 import logging
-from collections.abc import Callable
+import operator
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -32,7 +34,7 @@ from magical_athlete_simulator.core.mixins import (
     SetupPhaseMixin,
 )
 from magical_athlete_simulator.core.registry import RACER_ABILITIES
-from magical_athlete_simulator.engine.logging import ContextFilter
+from magical_athlete_simulator.engine.logging import ContextFilter, flush_logs
 from magical_athlete_simulator.engine.loop_detection import LoopDetector
 from magical_athlete_simulator.engine.movement import (
     handle_move_cmd,
@@ -49,7 +51,9 @@ from magical_athlete_simulator.racers import get_ability_classes
 
 if TYPE_CHECKING:
     import random
+    from collections.abc import Set as AbstractSet
 
+    from magical_athlete_simulator.core.abilities import Ability
     from magical_athlete_simulator.core.agent import Agent
     from magical_athlete_simulator.core.state import (
         GameState,
@@ -61,19 +65,35 @@ if TYPE_CHECKING:
 AbilityCallback = Callable[[GameEvent, int, "GameEngine"], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscriber:
     callback: AbilityCallback
     owner_idx: int
 
 
+# bisect key for the owner-sorted subscriber lists; attrgetter runs in C
+_subscriber_owner = operator.attrgetter("owner_idx")
+
+
 @dataclass
 class GameEngine:
     state: GameState
     rng: random.Random
     log_context: LogContext
     current_processing_event: ScheduledEvent | None = None
+    # Each list is kept sorted by owner_idx (stable), see publish_to_subscribers
     subscribers: dict[type[GameEvent], list[Subscriber]] = field(default_factory=dict)
+    # Dispatch order per (event type, current racer); dropped on any change
+    _ordered_subscribers: dict[tuple[type[GameEvent], int], list[Subscriber]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    # The same subscriptions grouped by owner, so dropping one racer's ability
+    # only visits that racer's entries
+    _subscriptions_by_owner: dict[int, list[tuple[type[GameEvent], Subscriber]]] = (
+        field(default_factory=dict, init=False, repr=False)
+    )
     agents: dict[int, Agent] = field(default_factory=dict)
 
     # Errors and loop detection
@@ -94,7 +114,7 @@ class GameEngine:
             self._logger.addFilter(ContextFilter(self))
 
         for racer in self.state.racers:
-            initial = RACER_ABILITIES.get(racer.name, set())
+            initial = RACER_ABILITIES.get(racer.name, frozenset())
             self.update_racer_abilities(racer.idx, initial)
 
             _ = self.agents.setdefault(racer.idx, SmartAgent())
@@ -106,8 +126,13 @@ class GameEngine:
     # --- Main Loop ---
     def run_race(self):
         while not self.state.race_over:
-            self.run_turn()
-            self._advance_turn()
+            self.run_and_advance_turn()
+        flush_logs()
+
+    def run_and_advance_turn(self):
+        """Play the current racer's turn, then hand over to the next racer."""
+        self.run_turn()
+        self._advance_turn()
 
     def run_turn(self):
         # 1. Reset detector for the new turn
@@ -119,11 +144,11 @@ class GameEngine:
         racer.reroll_count = 0
 
         self.log_context.start_turn_log(racer.repr)
-        self.log_info(f"=== START TURN: {racer.repr} ===")
+        self.log_info("=== START TURN: %s ===", racer.repr)
         racer.main_move_consumed = False
 
         if racer.tripped:
-            self.log_info(f"{racer.repr} recovers from Trip.")
+            self.log_info("%s recovers from Trip.", racer.repr)
             racer.tripped = False
             racer.main_move_consumed = True
             self.push_event(
@@ -157,21 +182,22 @@ class GameEngine:
             )
 
         while self.state.queue and not self.state.race_over:
-            # Prepare hashes for checks
-            current_board_hash = self._calculate_board_hash()
-            current_system_hash = self.state.get_state_hash()
-
             # --- Layer 1: Exact State Cycle (Least Harmful) ---
+            current_system_hash = self.state.get_state_hash()
             if self.loop_detector.check_exact_cycle(current_system_hash):
-                skipped = heapq.heappop(self.state.queue)
+                _, skipped = heapq.heappop(self.state.queue)
                 self.loop_detector.forget_event(skipped.serial)
                 self.log_warning(
-                    f"Infinite loop detected (Exact State Cycle). Dropping recursive event: {skipped.event}",
+                    "Infinite loop detected (Exact State Cycle). Dropping recursive event: %s",
+                    skipped.event,
                 )
                 continue
 
             # Peek/Pop the next event
-            sched = heapq.heappop(self.state.queue)
+            _, sched = heapq.heappop(self.state.queue)
+
+            # Layers 2 and 3 only need the board, so it's hashed after Layer 1
+            current_board_hash = self._calculate_board_hash()
 
             # --- Layer 2: Heuristic Detection (Surgical Fix) ---
             if self.loop_detector.check_heuristic_loop(
@@ -180,7 +206,8 @@ class GameEngine:
                 sched,
             ):
                 self.log_warning(
-                    f"MINOR_LOOP_DETECTED (Heuristic/Exploding). Dropping: {sched.event}",
+                    "MINOR_LOOP_DETECTED (Heuristic/Exploding). Dropping: %s",
+                    sched.event,
                 )
                 self.bug_reason = (
                     "MINOR_LOOP_DETECTED"
@@ -203,16 +230,22 @@ class GameEngine:
 
     def _calculate_board_hash(self) -> int:
         """Generates a hash of the physical board state."""
+        # A list comprehension is inlined (PEP 709) and builds the same tuple
+        # faster than tuple() over a generator
         racer_states = tuple(
-            (
-                r.position,
-                r.active,
-                r.tripped,
-                r.main_move_consumed,
-                r.reroll_count,
-                frozenset(r.active_abilities.keys()),
-            )
-            for r in self.state.racers
+            [
+                (
+                    r.position,
+                    r.active,
+                    r.tripped,
+                    r.main_move_consumed,
+                    r.reroll_count,
+                    # Cached and only rebuilt when abilities change; sorted names
+                    # compare like the set they came from
+                    r.sorted_abilities(),
+                )
+                for r in self.state.racers
+            ],
         )
         return hash((self.state.current_racer_idx, racer_states))
 
@@ -225,7 +258,8 @@ class GameEngine:
             self.state.next_turn_override = None
             self.state.current_racer_idx = next_idx
             self.log_info(
-                f"Turn Order Override: {self.get_racer(next_idx).repr} takes the next turn!",
+                "Turn Order Override: %s takes the next turn!",
+                self.get_racer(next_idx).repr,
             )
             return
 
@@ -246,7 +280,21 @@ class GameEngine:
         self.state.current_racer_idx = next_idx
 
     # --- Event Management ---
-    def push_event(self, event: GameEvent, priority: int | None = None):
+    def push_events(self, events: Iterable[GameEvent]):
+        """Schedules a batch of events raised from one unchanged board state."""
+        board_hash: int | None = None
+        for event in events:
+            if board_hash is None:
+                board_hash = self._calculate_board_hash()
+            self.push_event(event, board_hash=board_hash)
+
+    def push_event(
+        self,
+        event: GameEvent,
+        priority: int | None = None,
+        *,
+        board_hash: int | None = None,
+    ):
         if priority is not None:
             _priority = priority
         elif event.responsible_racer_idx is None:
@@ -283,23 +331,30 @@ class GameEngine:
         )
 
         # Notify loop detector of the board state at creation time
-        self.loop_detector.record_event_creation(
-            sched.serial,
-            self._calculate_board_hash(),
-        )
+        if board_hash is None:
+            board_hash = self._calculate_board_hash()
+        self.loop_detector.record_event_creation(sched.serial, board_hash)
 
-        msg = f"{sched}"
-        self.log_debug(msg)
-        heapq.heappush(self.state.queue, sched)
+        # Lazy %-args: repr of the event dataclass is only built if emitted
+        self.log_debug("%s", sched)
+        heapq.heappush(self.state.queue, (sched.sort_key, sched))
 
         if (
             isinstance(event, EmitsAbilityTriggeredEvent)
             and event.emit_ability_triggered == "immediately"
         ):
-            self.push_event(AbilityTriggeredEvent.from_event(event))
+            self.push_event(
+                AbilityTriggeredEvent.from_event(event),
+                board_hash=board_hash,
+            )
 
-    def _rebuild_subscribers(self):
+    def clear_subscribers(self):
         self.subscribers.clear()
+        self._ordered_subscribers.clear()
+        self._subscriptions_by_owner.clear()
+
+    def _rebuild_subscribers(self):
+        self.clear_subscribers()
         for racer in self.state.racers:
             for ability in racer.active_abilities.values():
                 ability.register(self, racer.idx)
@@ -312,30 +367,36 @@ class GameEngine:
     ):
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
-        self.subscribers[event_type].append(Subscriber(callback, owner_idx))
+        sub = Subscriber(callback, owner_idx)
+        bisect.insort_right(self.subscribers[event_type], sub, key=_subscriber_owner)
+        self._subscriptions_by_owner.setdefault(owner_idx, []).append(
+            (event_type, sub),
+        )
+        self._ordered_subscribers.clear()
 
-    def update_racer_abilities(self, racer_idx: int, new_abilities: set[AbilityName]):
+    def update_racer_abilities(
+        self,
+        racer_idx: int,
+        new_abilities: AbstractSet[AbilityName],
+    ):
         racer = self.get_racer(racer_idx)
         current_instances = racer.active_abilities
         old_names = set(current_instances.keys())
 
         removed = old_names - new_abilities
         added = new_abilities - old_names
+        if removed or added:
+            self._ordered_subscribers.clear()
 
+        # The name cache is dropped after every change, so the on_loss/on_gain
+        # callbacks never see a stale tuple
         for name in removed:
             instance = current_instances.pop(name)
+            racer.invalidate_ability_cache()
             if isinstance(instance, LifecycleManagedMixin):
                 instance.on_loss(self, racer_idx)
 
-            for event_type in self.subscribers:
-                self.subscribers[event_type] = [
-                    sub
-                    for sub in self.subscribers[event_type]
-                    if not (
-                        sub.owner_idx == racer_idx
-                        and getattr(sub.callback, "__self__", None) == instance
-                    )
-                ]
+            self._unsubscribe_instance(racer_idx, instance)
 
         for name in added:
             ability_cls = get_ability_classes().get(name)
@@ -343,51 +404,50 @@ class GameEngine:
                 instance = ability_cls(name=name)
                 instance.register(self, racer_idx)
                 current_instances[name] = instance
+                racer.invalidate_ability_cache()
                 if isinstance(instance, LifecycleManagedMixin):
                     instance.on_gain(self, racer_idx)
 
+    def _unsubscribe_instance(self, owner_idx: int, instance: Ability):
+        owned = self._subscriptions_by_owner.get(owner_idx)
+        if not owned:
+            return
+        kept: list[tuple[type[GameEvent], Subscriber]] = []
+        for event_type, sub in owned:
+            if getattr(sub.callback, "__self__", None) is instance:
+                self.subscribers[event_type].remove(sub)
+            else:
+                kept.append((event_type, sub))
+        owned[:] = kept
+
     def publish_to_subscribers(self, event: GameEvent):
-        if type(event) not in self.subscribers:
+        event_type = type(event)
+        if event_type not in self.subscribers:
             return
-        subs = self.subscribers[type(event)]
-        curr = self.state.current_racer_idx
-        count = len(self.state.racers)
-        ordered_subs = sorted(subs, key=lambda s: (s.owner_idx - curr) % count)
+        key = (event_type, self.state.current_racer_idx)
+        ordered_subs = self._ordered_subscribers.get(key)
+        if ordered_subs is None:
+            subs = self.subscribers[event_type]
+            # Turn order from the current racer is a rotation of the
+            # owner-sorted list. The cached list is never mutated in place,
+            # so handlers that resubscribe mid-publish don't disturb the loop
+            split = bisect.bisect_left(
+                subs,
+                self.state.current_racer_idx,
+                key=_subscriber_owner,
+            )
+            ordered_subs = subs[split:] + subs[:split]
+            self._ordered_subscribers[key] = ordered_subs
 
         for sub in ordered_subs:
             sub.callback(event, sub.owner_idx, self)
 
     def _handle_event(self, event: GameEvent):
-        match event:
-            case (
-                TurnStartEvent()
-                | PassingEvent()
-                | AbilityTriggeredEvent()
-                | RollModificationWindowEvent()
-                | RacerFinishedEvent()
-                | RollResultEvent()
-            ):
-                self.publish_to_subscribers(event)
-            case TripCmdEvent():
-                handle_trip_cmd(self, event)
-            case MoveCmdEvent():
-                handle_move_cmd(self, event)
-            case SimultaneousMoveCmdEvent():
-                handle_simultaneous_move_cmd(self, event)
-            case WarpCmdEvent():
-                handle_warp_cmd(self, event)
-            case SimultaneousWarpCmdEvent():
-                handle_simultaneous_warp_cmd(self, event)
-
-            case PerformMainRollEvent():
-                handle_perform_main_roll(self, event)
-
-            case ResolveMainMoveEvent():
-                self.publish_to_subscribers(event)
-                resolve_main_move(self, event)
-
-            case _:
-                pass
+        # Event classes are never subclassed, so an exact-type lookup matches
+        # what class patterns would; unlisted types need no processing
+        handler = _EVENT_HANDLERS.get(type(event))
+        if handler is not None:
+            handler(self, event)
 
         if self.on_event_processed:
             self.on_event_processed(self, event)
@@ -425,7 +485,9 @@ class GameEngine:
         if not racer.main_move_consumed:
             racer.main_move_consumed = True
             self.log_info(
-                f"{racer.repr} has their main move skipped (Source: {source}).",
+                "%s has their main move skipped (Source: %s).",
+                racer.repr,
+                source,
             )
             self.push_event(
                 MainMoveSkippedEvent(
@@ -435,6 +497,10 @@ class GameEngine:
             )
 
     # -- Logging --
+    def log_enabled(self, level: int) -> bool:
+        """Whether a message at `level` would be emitted; guards costly log arguments."""
+        return self.verbose and self._logger.isEnabledFor(level)
+
     def _log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         if not self.verbose:
             return
@@ -451,3 +517,28 @@ class GameEngine:
 
     def log_error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         self._log(logging.ERROR, msg, *args, **kwargs)
+
+
+def _publish_and_resolve_main_move(
+    engine: GameEngine,
+    event: ResolveMainMoveEvent,
+) -> None:
+    engine.publish_to_subscribers(event)
+    resolve_main_move(engine, event)
+
+
+_EVENT_HANDLERS: dict[type[GameEvent], Callable[[GameEngine, Any], None]] = {
+    TurnStartEvent: GameEngine.publish_to_subscribers,
+    PassingEvent: GameEngine.publish_to_subscribers,
+    AbilityTriggeredEvent: GameEngine.publish_to_subscribers,
+    RollModificationWindowEvent: GameEngine.publish_to_subscribers,
+    RacerFinishedEvent: GameEngine.publish_to_subscribers,
+    RollResultEvent: GameEngine.publish_to_subscribers,
+    TripCmdEvent: handle_trip_cmd,
+    MoveCmdEvent: handle_move_cmd,
+    SimultaneousMoveCmdEvent: handle_simultaneous_move_cmd,
+    WarpCmdEvent: handle_warp_cmd,
+    SimultaneousWarpCmdEvent: handle_simultaneous_warp_cmd,
+    PerformMainRollEvent: handle_perform_main_roll,
+    ResolveMainMoveEvent: _publish_and_resolve_main_move,
+}
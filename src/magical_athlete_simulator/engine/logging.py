@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, get_args, override
+from logging.handlers import MemoryHandler
+from typing import TYPE_CHECKING, Protocol, cast, get_args, override
 
 from rich.highlighter import Highlighter
 from rich.logging import RichHandler
@@ -19,11 +20,6 @@ RACER_NAMES = set(get_args(RacerName))
 ABILITY_NAMES = set(get_args(AbilityName))
 MODIFIER_NAMES = set(get_args(ModifierName))
 
-# Precompiled regex patterns for highlighting
-ABILITY_PATTERN = re.compile(rf"\b({'|'.join(map(re.escape, ABILITY_NAMES))})\b")
-MODIFIER_PATTERN = re.compile(rf"\b({'|'.join(map(re.escape, MODIFIER_NAMES))})\b")
-RACER_PATTERN = re.compile(rf"(?<!\[)\b({'|'.join(map(re.escape, RACER_NAMES))})\b")
-
 
 # Simple color theme for Rich
 # Updated Color Theme for High Contrast Dark Mode
@@ -41,6 +37,9 @@ COLOR = {
     "dice_roll": "bold plum1",  # Brighter purple
 }
 
+# Records held back before they are written to the terminal in one burst
+LOG_BUFFER_CAPACITY = 4096
+
 
 class ContextFilter(logging.Filter):
     """Inject per-engine runtime context into every log record."""
@@ -62,48 +61,144 @@ class ContextFilter(logging.Filter):
         return True
 
 
+class _ContextRecord(Protocol):
+    """The attributes ContextFilter sets on a log record."""
+
+    engine_level: int
+    engine_id: int
+    total_turn: int
+    racer_repr: str
+    turn_log_count: int
+
+
+# Prefix for records not annotated by ContextFilter (e.g. the DB manager)
+_DEFAULT_PREFIX = "0:0 0._.0"
+# Markup tags around the prefix, built once instead of per record
+_PREFIX_OPEN = f"[{COLOR['prefix']}]"
+_PREFIX_CLOSE = f"[/{COLOR['prefix']}]  "
+
+
 class RichMarkupFormatter(logging.Formatter):
+    # No level short-circuit needed here: Logger.isEnabledFor gates the record
+    # before filters run, and callHandlers checks the handler level before
+    # format() is ever called, so this only runs for records being emitted.
     @override
     def format(self, record: logging.LogRecord) -> str:
-        total_turn = getattr(record, "total_turn", 0)
-        turn_log_count = getattr(record, "turn_log_count", 0)
-        racer_repr = getattr(record, "racer_repr", "_")
-
-        engine_level = getattr(record, "engine_level", 0)
-        engine_id = getattr(record, "engine_id", 0)
-        prefix = (
-            f"{engine_level}:{engine_id} {total_turn}.{racer_repr}.{turn_log_count}"
-        )
-
-        message = record.getMessage()
-        return f"[{COLOR['prefix']}]{prefix}[/{COLOR['prefix']}]  {message}"
+        # ContextFilter sets these on every engine record: read them directly
+        # and only fall back to the defaults for records that skipped it.
+        # Via object: LogRecord itself doesn't declare the injected fields
+        ctx = cast("_ContextRecord", cast("object", record))
+        try:
+            prefix = f"{ctx.engine_level}:{ctx.engine_id} {ctx.total_turn}.{ctx.racer_repr}.{ctx.turn_log_count}"
+        except AttributeError:
+            prefix = _DEFAULT_PREFIX
+
+        return f"{_PREFIX_OPEN}{prefix}{_PREFIX_CLOSE}{record.getMessage()}"
+
+
+# Every highlight rule in one alternation, so a record is scanned once instead
+# of once per rule. Group names map to styles in _STYLE_BY_GROUP.
+# Racer/ability/modifier names are all single CamelCase words, so instead of
+# three large alternations (backtracked per position) any capitalized word is
+# matched and looked up in _NAME_STYLES. It must stay the last alternative so
+# fixed tokens like "VP:" win at the same position.
+_HIGHLIGHT_RULES = (
+    r"(?P<move>\bMove\b|\bMoving\b)",
+    r"(?P<warp>\bPushing\b|\bWarp\b)",
+    r"(?P<main_move>\bMainMove\b)",
+    r"(?P<board>\bBOARD\b)",
+    r"(?P<dice_roll>\bDice Roll\b)",
+    r"(?P<warning>!!!)",
+    r"(?P<vp>\bVP:\b)",
+    r"(?P<vp_gain>\b\+1 VP\b)",
+    r"(?P<vp_loss>\b-1 VP\b)",
+    r"(?P<name>\b[A-Z]\w*\b)",
+)
+_HIGHLIGHT_RE = re.compile("|".join(_HIGHLIGHT_RULES))
+_STYLE_BY_GROUP = {
+    "move": COLOR["move"],
+    "warp": COLOR["warp"],
+    "main_move": COLOR["main_move"],
+    "board": COLOR["board"],
+    "dice_roll": COLOR["dice_roll"],
+    "warning": COLOR["warning"],
+    "vp": "bold yellow",
+    "vp_gain": "bold green",
+    "vp_loss": "bold red",
+}
+_NAME_STYLES: dict[str, str] = {
+    **dict.fromkeys(ABILITY_NAMES, COLOR["ability"]),
+    **dict.fromkeys(MODIFIER_NAMES, COLOR["modifier"]),
+    **dict.fromkeys(RACER_NAMES, COLOR["racer"]),
+}
 
 
 class GameLogHighlighter(Highlighter):
     @override
     def highlight(self, text: Text) -> None:
-        # Movement-related words
-        text.highlight_regex(r"\bMove\b", COLOR["move"])
-        text.highlight_regex(r"\bMoving\b", COLOR["move"])
-        text.highlight_regex(r"\bPushing\b", COLOR["warp"])
-        text.highlight_regex(r"\bMainMove\b", COLOR["main_move"])
-        text.highlight_regex(r"\bWarp\b", COLOR["warp"])
-        text.highlight_regex(r"\bBOARD\b", COLOR["board"])
-        text.highlight_regex(r"\bDice Roll\b", COLOR["dice_roll"])
-
-        # Abilities and racer names
-        text.highlight_regex(ABILITY_PATTERN, COLOR["ability"])
-        text.highlight_regex(MODIFIER_PATTERN, COLOR["modifier"])
-        text.highlight_regex(RACER_PATTERN, COLOR["racer"])
-
-        # Emphasis and VP
-        text.highlight_regex(r"!!!", COLOR["warning"])
-        text.highlight_regex(r"\bVP:\b", "bold yellow")
-        text.highlight_regex(r"\b\+1 VP\b", "bold green")
-        text.highlight_regex(r"\b-1 VP\b", "bold red")
-
-
-def configure_logging() -> None:
+        plain = text.plain
+        stylize = text.stylize
+        name_styles = _NAME_STYLES
+        for match in _HIGHLIGHT_RE.finditer(plain):
+            start, end = match.span()
+            group = match.lastgroup
+            if group != "name":
+                stylize(_STYLE_BY_GROUP[group], start, end)  # pyright: ignore[reportArgumentType]
+                continue
+            word = match.group()
+            style = name_styles.get(word)
+            if style is None:
+                continue
+            # Racer names right after "[" are markup: leave "[Name" alone
+            if start and plain[start - 1] == "[" and word in RACER_NAMES:
+                continue
+            stylize(style, start, end)
+
+
+class BufferedRichHandler(MemoryHandler):
+    """
+    Hold records and write them to the Rich console in one burst.
+
+    Flushes when the buffer is full, on ERROR and above, via `flush_logs()`
+    (end of each turn / race) and at interpreter shutdown.
+    """
+
+    def __init__(self, target: RichHandler, capacity: int = LOG_BUFFER_CAPACITY):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.rich_handler: RichHandler = target
+
+    @override
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        # Inside the console context Rich renders into its own buffer and
+        # writes everything on exit, instead of once per record.
+        with self.rich_handler.console:
+            super().flush()
+
+
+def flush_logs() -> None:
+    """Write out any records buffered by the root logger's handlers."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+_configured = False
+
+
+def configure_logging(*, force: bool = False) -> None:
+    """
+    Route all records through the buffered Rich handler.
+
+    Engine records get their prefix fields from the `ContextFilter` each
+    verbose GameEngine installs on its logger. Repeated calls are no-ops
+    unless `force` is set, so the buffered handler survives across races.
+    """
+    global _configured  # noqa: PLW0603
+    if _configured and not force:
+        return
+    _configured = True
+
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     handler = RichHandler(
@@ -114,5 +209,5 @@ def configure_logging() -> None:
     )
     handler.setFormatter(RichMarkupFormatter())
     logger.handlers.clear()
-    logger.addHandler(handler)
+    logger.addHandler(BufferedRichHandler(handler))
     logger.propagate = False
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import Counter
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -12,18 +11,11 @@ MAX_IDENTICAL_BOARD_VISITS = 200  # Threshold for physical board state oscillati
 HEURISTIC_LOOP_TOLERANCE = 5  # Threshold for repeated actions on the same state
 
 
-@dataclass(frozen=True)
-class HeuristicKey:
-    """
-    Composite key used to detect logical loops where the board state resets
-    but the event queue grows or stagnates (e.g., oscillating moves).
-    """
-
-    board_hash: int
-    event_type: type[GameEvent]
-    target_idx: int | None
-    responsible_idx: int | None
-    phase: int | None
+# Composite key used to detect logical loops where the board state resets but
+# the event queue grows or stagnates (e.g., oscillating moves):
+# (board_hash, event_type, target_idx, responsible_idx, phase).
+# A plain tuple hashes and compares in C, unlike a frozen dataclass.
+type HeuristicKey = tuple[int, type[GameEvent], int | None, int | None, int | None]
 
 
 @dataclass
@@ -46,7 +38,7 @@ class LoopDetector:
     """
 
     # Global Sanity State
-    board_visit_counts: Counter[int] = field(default_factory=Counter)
+    board_visit_counts: dict[int, int] = field(default_factory=dict)
     last_board_hash: int | None = None
 
     # Exact Cycle State
@@ -101,20 +93,19 @@ class LoopDetector:
             return False
 
         ev = sched.event
-        key = HeuristicKey(
-            board_hash=current_board_hash,
-            event_type=type(ev),
-            target_idx=getattr(ev, "target_racer_idx", None),
-            responsible_idx=getattr(ev, "responsible_racer_idx", None),
-            phase=getattr(ev, "phase", None),
+        key: HeuristicKey = (
+            current_board_hash,
+            type(ev),
+            getattr(ev, "target_racer_idx", None),
+            ev.responsible_racer_idx,
+            ev.phase,
         )
 
-        if key not in self.heuristic_history:
+        data = self.heuristic_history.get(key)
+        if data is None:
             self.heuristic_history[key] = LoopTrackingData(current_queue_len, 1)
             return False
 
-        data = self.heuristic_history[key]
-
         # If queue has shrunk, we are making progress; reset strikes
         if current_queue_len < data.min_queue_len:
             data.min_queue_len = current_queue_len
@@ -130,9 +121,13 @@ class LoopDetector:
         Layer 3 (Global): Returns True if the board state has oscillated too many times
         in total during this turn. Acts as a final failsafe.
         """
+        counts = self.board_visit_counts
         # Only increment count on state entry/re-entry
         if current_board_hash != self.last_board_hash:
-            self.board_visit_counts[current_board_hash] += 1
+            visits = counts.get(current_board_hash, 0) + 1
+            counts[current_board_hash] = visits
             self.last_board_hash = current_board_hash
+        else:
+            visits = counts[current_board_hash]
 
-        return self.board_visit_counts[current_board_hash] > MAX_IDENTICAL_BOARD_VISITS
+        return visits > MAX_IDENTICAL_BOARD_VISITS
@@ -60,7 +60,7 @@ def _resolve_move_path(engine: GameEngine, evt: MoveCmdEvent) -> int:
         if isinstance(mod, MovementValidatorMixin) and not mod.validate_move(
             engine, racer.idx, start, phys_end
         ):
-            engine.log_info(f"Move vetoed by {mod.name}")
+            engine.log_info("Move vetoed by %s", mod.name)
             return start  # Cancel move
 
     # --- 3. RESOLVE BOARD INTERACTIONS (Huge Baby) ---
@@ -78,7 +78,9 @@ def _resolve_move_path(engine: GameEngine, evt: MoveCmdEvent) -> int:
     # --- 4. SAFETY CLAMP ---
     if final_end < 0:
         engine.log_info(
-            f"Attempted to move {racer.repr} to {final_end}. Instead moving to starting tile (0).",
+            "Attempted to move %s to %s. Instead moving to starting tile (0).",
+            racer.repr,
+            final_end,
         )
         final_end = 0
 
@@ -92,31 +94,47 @@ def _process_passing_and_logs(
     end_tile: int,
 ):
     racer = engine.get_racer(evt.target_racer_idx)
-    engine.log_info(f"Move: {racer.repr} {start_tile}->{end_tile} ({evt.source})")
+    engine.log_info(
+        "Move: %s %s->%s (%s)",
+        racer.repr,
+        start_tile,
+        end_tile,
+        evt.source,
+    )
 
     if evt.distance != 0:
         step = 1 if evt.distance > 0 else -1
-        current = start_tile + step
-        while current != end_tile:
-            if 0 <= current < engine.state.board.length:
-                victims = engine.get_racers_at_position(
-                    tile_idx=current,
-                    except_racer_idx=evt.target_racer_idx,
-                )
-                for v in victims:
-                    engine.push_event(
-                        PassingEvent(
-                            responsible_racer_idx=evt.target_racer_idx,
-                            target_racer_idx=v.idx,
-                            phase=evt.phase,
-                            source=evt.source,
-                            tile_idx=current,
-                        ),
-                    )
-            current += step
-            # Safety break
-            if (step > 0 and current > end_tile) or (step < 0 and current < end_tile):
-                break
+        # Tiles strictly between start and end in the direction of travel.
+        # If the end lies behind us (or equals start), only start + step counts.
+        if step > 0:
+            lo = start_tile + 1
+            hi = end_tile - 1 if end_tile > start_tile else start_tile + 1
+        else:
+            lo = end_tile + 1 if end_tile < start_tile else start_tile - 1
+            hi = start_tile - 1
+        lo = max(lo, 0)
+        hi = min(hi, engine.state.board.length - 1)
+
+        mover_idx, phase, source = evt.target_racer_idx, evt.phase, evt.source
+        # One pass over the racers instead of one scan per passed tile
+        victims = [
+            r
+            for r in engine.state.racers
+            if lo <= r.position <= hi and r.idx != mover_idx and r.active
+        ]
+        # Stable sort: tiles in travel order, racer order within a tile
+        victims.sort(key=lambda r: r.position * step)
+        # Pushing doesn't move anyone, so the batch shares one board hash
+        engine.push_events(
+            PassingEvent(
+                responsible_racer_idx=mover_idx,
+                target_racer_idx=v.idx,
+                phase=phase,
+                source=source,
+                tile_idx=v.position,
+            )
+            for v in victims
+        )
 
 
 def _finalize_committed_move(
@@ -244,7 +262,8 @@ def _resolve_warp_destination(
     )
     if resolved < 0:
         engine.log_info(
-            f"Attempted to warp to {resolved}. Instead moving to starting tile (0).",
+            "Attempted to warp to %s. Instead moving to starting tile (0).",
+            resolved,
         )
         resolved = 0
     return resolved
@@ -259,7 +278,7 @@ def _finalize_committed_warp(
 ):
     racer = engine.get_racer(event.target_racer_idx)
 
-    engine.log_info(f"Warp: {racer.repr} -> {end_tile} ({event.source})")
+    engine.log_info("Warp: %s -> %s (%s)", racer.repr, end_tile, event.source)
     racer.position = end_tile
     if check_finish(engine, racer):
         return
@@ -407,7 +426,7 @@ def handle_trip_cmd(engine: GameEngine, evt: TripCmdEvent):
 
     # Apply effect
     racer.tripped = True
-    engine.log_info(f"{evt.source}: {racer.repr} is now Tripped.")
+    engine.log_info("%s: %s is now Tripped.", evt.source, racer.repr)
 
     if evt.emit_ability_triggered != "never":
         engine.push_event(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 from magical_athlete_simulator.core.events import (
@@ -14,6 +15,8 @@ from magical_athlete_simulator.core.mixins import RollModificationMixin
 from magical_athlete_simulator.engine.movement import push_move
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from magical_athlete_simulator.core.types import Source
     from magical_athlete_simulator.engine.game_engine import GameEngine
 
@@ -21,39 +24,51 @@ if TYPE_CHECKING:
 def handle_perform_main_roll(engine: GameEngine, event: PerformMainRollEvent) -> None:
     racer = engine.get_racer(event.target_racer_idx)
     if racer.main_move_consumed:
-        engine.log_info(f"Skipping roll because {racer.repr} already used main move.")
+        engine.log_info("Skipping roll because %s already used main move.", racer.repr)
         return
 
     engine.state.roll_state.serial_id += 1
     current_serial = engine.state.roll_state.serial_id
 
     base = engine.rng.randint(1, 6)
-    query = MoveDistanceQuery(event.target_racer_idx, base)
-
-    # Apply ALL modifiers attached to this racer
-    for mod in engine.get_racer(event.target_racer_idx).modifiers:
-        if isinstance(mod, RollModificationMixin):
-            mod.modify_roll(
-                query,
-                mod.owner_idx,
-                engine,
-                rolling_racer_idx=event.target_racer_idx,
-            )
+    modifier_sources: Sequence[tuple[str, int]] = ()
+    if racer.modifiers:
+        query = MoveDistanceQuery(event.target_racer_idx, base)
+
+        # Apply ALL modifiers attached to this racer
+        for mod in racer.modifiers:
+            if isinstance(mod, RollModificationMixin):
+                mod.modify_roll(
+                    query,
+                    mod.owner_idx,
+                    engine,
+                    rolling_racer_idx=event.target_racer_idx,
+                )
+
+        final = query.final_value
+        modifier_sources = query.modifier_sources
+    else:
+        # Nothing can modify the roll, and a die never shows less than 1
+        final = base
 
-    final = query.final_value
     engine.state.roll_state.base_value = base
     engine.state.roll_state.final_value = final
 
-    # Logging with sources
-    if query.modifier_sources:
-        parts = [f"{name}:{delta:+d}" for (name, delta) in query.modifier_sources]
-        mods_str = ", ".join(parts)
-        total_delta = sum(delta for _, delta in query.modifier_sources)
-        engine.log_info(
-            f"Dice Roll: {base} (Mods: {total_delta} [{mods_str}]) -> Result: {final}",
-        )
-    else:
-        engine.log_info(f"Dice Roll: {base} (Mods: 0) -> Result: {final}")
+    # Logging with sources; the breakdown string is only built when it's shown
+    if engine.log_enabled(logging.INFO):
+        if modifier_sources:
+            parts = [f"{name}:{delta:+d}" for (name, delta) in modifier_sources]
+            mods_str = ", ".join(parts)
+            total_delta = sum(delta for _, delta in modifier_sources)
+            engine.log_info(
+                "Dice Roll: %s (Mods: %s [%s]) -> Result: %s",
+                base,
+                total_delta,
+                mods_str,
+                final,
+            )
+        else:
+            engine.log_info("Dice Roll: %s (Mods: 0) -> Result: %s", base, final)
 
     # 3. Fire the 'Window' event. Listeners can call trigger_reroll() here.
     engine.push_event(
@@ -120,7 +135,9 @@ def resolve_main_move(engine: GameEngine, event: ResolveMainMoveEvent):
 def trigger_reroll(engine: GameEngine, source_idx: int, source: Source):
     """Cancels the current roll resolution and schedules a new roll immediately."""
     engine.log_info(
-        f"RE-ROLL TRIGGERED by {engine.get_racer(source_idx).name} ({source})",
+        "RE-ROLL TRIGGERED by %s (%s)",
+        engine.get_racer(source_idx).name,
+        source,
     )
     # Increment serial to kill any pending ResolveMainMove events
     engine.state.roll_state.serial_id += 1
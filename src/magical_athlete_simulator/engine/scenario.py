@@ -18,6 +18,7 @@ from magical_athlete_simulator.core.state import (
 from magical_athlete_simulator.engine import ENGINE_ID_COUNTER
 from magical_athlete_simulator.engine.board import BOARD_DEFINITIONS, Board
 from magical_athlete_simulator.engine.game_engine import GameEngine
+from magical_athlete_simulator.engine.logging import flush_logs
 
 if TYPE_CHECKING:
     from magical_athlete_simulator.core.types import AbilityName, RacerName
@@ -33,18 +34,21 @@ class RacerConfig:
     start_pos: int = 0
 
     def __post_init__(self):
-        if self.abilities is None:
-            if self.name not in RACER_ABILITIES:
-                msg = f"Racer '{self.name}' not found in RACER_ABILITIES."
-                raise ValueError(msg)
+        # Explicit abilities need no registry lookup
+        if self.abilities is not None:
+            return
 
-            defaults = RACER_ABILITIES[self.name]
+        defaults = RACER_ABILITIES.get(self.name)
+        if defaults is None:
+            msg = f"Racer '{self.name}' not found in RACER_ABILITIES."
+            raise ValueError(msg)
 
-            if not defaults:
-                msg = f"Racer '{self.name}' has no default abilities defined."
-                raise ValueError(msg)
+        if not defaults:
+            msg = f"Racer '{self.name}' has no default abilities defined."
+            raise ValueError(msg)
 
-            self.abilities = defaults.copy()
+        # Copied so callers can edit their config without touching the registry
+        self.abilities = set(defaults)
 
 
 @dataclass
@@ -116,8 +120,8 @@ class GameScenario:
 
     def run_turn(self):
         """Run one turn and advance to the next racer."""
-        self.engine.run_turn()
-        self.engine._advance_turn()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        self.engine.run_and_advance_turn()
+        flush_logs()
 
     def run_turns(self, n: int):
         """Run n consecutive turns."""
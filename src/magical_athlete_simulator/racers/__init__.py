@@ -1,8 +1,7 @@
 from __future__ import annotations
 
+import functools
 import importlib
-import pkgutil
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from magical_athlete_simulator.core.abilities import Ability
@@ -12,13 +11,43 @@ if TYPE_CHECKING:
     from magical_athlete_simulator.core.types import AbilityName
 
 
+# Explicit manifest instead of scanning the package directory at runtime.
+# Add new racer modules here (tests/misc/test_racer_manifest.py checks it).
+RACER_MODULES: tuple[str, ...] = (
+    "baba_yaga",
+    "banana",
+    "blimp",
+    "centaur",
+    "coach",
+    "copycat",
+    "flip_flop",
+    "genius",
+    "gunk",
+    "hare",
+    "huge_baby",
+    "leaptoad",
+    "lovable_loser",
+    "magician",
+    "mastermind",
+    "party_animal",
+    "romantic",
+    "scoocher",
+    "sisyphus",
+    "skipper",
+    "stickler",
+    "suckerfish",
+)
+
+
 def _import_modules() -> None:
-    for _, module_name, _ in pkgutil.iter_modules([Path(__file__).parent]):
+    for module_name in RACER_MODULES:
         _ = importlib.import_module(f"{__name__}.{module_name}")
 
 
+# Looked up for every ability instantiation; the class set is fixed once all
+# racer modules are imported. Callers must not mutate the returned dict.
+@functools.cache
 def get_ability_classes() -> dict[AbilityName, type[Ability]]:
-    # Dynamically import all modules in this package
     _import_modules()
     return {cls.name: cls for cls in Ability.__subclasses__()}
 
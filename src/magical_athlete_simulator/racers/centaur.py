@@ -40,7 +40,11 @@ class AbilityTrample(Ability):
         if victim.finished:
             return "skip_trigger"
 
-        engine.log_info(f"{self.name}: Centaur passed {victim.repr}. Queuing -2 move.")
+        engine.log_info(
+            "%s: Centaur passed %s. Queuing -2 move.",
+            self.name,
+            victim.repr,
+        )
         push_move(
             engine,
             -2,
@@ -57,7 +57,7 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[RacerState]):
         if not valid_targets:
             # Only log at TurnStart to avoid spamming logs on every move
             if isinstance(event, TurnStartEvent):
-                engine.log_info(f"{self.name}: No one ahead to copy.")
+                engine.log_info("%s: No one ahead to copy.", self.name)
             engine.update_racer_abilities(owner_idx, new_abilities={self.name})
             return "skip_trigger"
 
@@ -75,14 +75,18 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[RacerState]):
             ),
         )
 
-        if target is None or target.abilities == me.abilities.difference({self.name}):
+        if target is None:
             return "skip_trigger"
 
-        engine.log_info(f"{self.name}: {me.repr} decided to copy {target.repr}.")
+        # `abilities` is a fresh set, so it doubles as the new ability set
+        new_abilities = target.abilities
+        if new_abilities == me.abilities.difference({self.name}):
+            return "skip_trigger"
+
+        engine.log_info("%s: %s decided to copy %s.", self.name, me.repr, target.repr)
 
         # 4. Perform the Update
         # This registers the new ability with the engine, but it won't run in the current loop.
-        new_abilities = set(target.abilities)
         new_abilities.add(self.name)
         engine.update_racer_abilities(owner_idx, new_abilities)
 
@@ -64,7 +64,7 @@ class AbilityGenius(Ability, SelectionDecisionMixin[int]):
                 ),
             )
 
-            engine.log_info(f"{self.name}: Predicts a roll of {self.prediction}.")
+            engine.log_info("%s: Predicts a roll of %s.", self.name, self.prediction)
             return AbilityTriggeredEvent(
                 responsible_racer_idx=owner_idx,
                 source=self.name,
@@ -81,7 +81,9 @@ class AbilityGenius(Ability, SelectionDecisionMixin[int]):
         ):
             me = engine.get_racer(owner_idx)
             engine.log_info(
-                f"{self.name}: Prediction Correct! {me.repr} gets an extra turn.",
+                "%s: Prediction Correct! %s gets an extra turn.",
+                self.name,
+                me.repr,
             )
 
             # Set the override.
@@ -172,7 +172,7 @@ class HugeBabyPush(Ability, LifecycleManagedMixin):
                     source=self.name,
                     responsible_racer_idx=None,
                 )
-                engine.log_info(f"HugeBaby pushes {v.repr} to {target}")
+                engine.log_info("HugeBaby pushes %s to %s", v.repr, target)
 
                 engine.push_event(
                     AbilityTriggeredEvent(
@@ -39,7 +39,9 @@ class LovableLoserBonus(Ability):
         if me.position < min_others:
             me.victory_points += 1
             engine.log_info(
-                f"{me.repr} is sole last place! Gains +1 VP (Total: {me.victory_points}).",
+                "%s is sole last place! Gains +1 VP (Total: %s).",
+                me.repr,
+                me.victory_points,
             )
 
         return "skip_trigger"
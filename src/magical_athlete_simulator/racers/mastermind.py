@@ -73,7 +73,9 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[RacerState]):
 
                 owner = engine.get_racer(owner_idx)
                 engine.log_info(
-                    f"{owner.repr} predicts {target_racer.name} will win the race!",
+                    "%s predicts %s will win the race!",
+                    owner.repr,
+                    target_racer.name,
                 )
 
                 return AbilityTriggeredEvent(
@@ -92,17 +94,19 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[RacerState]):
                 return "skip_trigger"
 
             if self.prediction is None:
-                engine.log_info(f"{owner.repr} did not predict anything!")
+                engine.log_info("%s did not predict anything!", owner.repr)
                 return "skip_trigger"
 
             winner = engine.state.racers[self.prediction]
 
             if event.target_racer_idx != self.prediction:
-                engine.log_info(f"{owner.repr} predicted wrong!")
+                engine.log_info("%s predicted wrong!", owner.repr)
                 return "skip_trigger"
             else:
                 engine.log_info(
-                    f"{owner.repr}'s prediction was correct! {winner.repr} won!",
+                    "%s's prediction was correct! %s won!",
+                    owner.repr,
+                    winner.repr,
                 )
 
                 if not owner.finished:
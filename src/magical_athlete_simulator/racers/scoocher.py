@@ -55,7 +55,7 @@ class AbilityScoochStep(Ability):
 
         cause_msg = f"Saw {source_racer.repr} use {event.source}{target_msg}"
 
-        engine.log_info(f"{owner_idx}:{self.name}: {cause_msg} -> Queue Moving 1")
+        engine.log_info("%s:%s: %s -> Queue Moving 1", owner_idx, self.name, cause_msg)
         push_move(
             engine,
             1,
@@ -35,7 +35,9 @@ class AbilitySkipper(Ability):
 
         if event.roll_serial != engine.state.roll_state.serial_id:
             engine.log_debug(
-                f"{engine.get_racer(owner_idx).repr} ignores stale roll resolution for {self.name}.",
+                "%s ignores stale roll resolution for %s.",
+                engine.get_racer(owner_idx).repr,
+                self.name,
             )
             return "skip_trigger"
 
@@ -43,7 +45,9 @@ class AbilitySkipper(Ability):
         if engine.state.roll_state.base_value == 1:
             me = engine.get_racer(owner_idx)
             engine.log_info(
-                f"{self.name}: A 1 was rolled! {me.repr} steals the next turn!",
+                "%s: A 1 was rolled! %s steals the next turn!",
+                self.name,
+                me.repr,
             )
 
             # Simple override. If Genius already set this, we overwrite it.
@@ -42,7 +42,10 @@ class SticklerConstraint(RacerModifier, MovementValidatorMixin):
         board_len = engine.state.board.length
         if end_tile > board_len:
             engine.log_info(
-                f"Stickler Constraint: {engine.get_racer(racer_idx).repr} cannot finish unless landing exactly on {board_len}. Destination {end_tile} is invalid.",
+                "Stickler Constraint: %s cannot finish unless landing exactly on %s. Destination %s is invalid.",
+                engine.get_racer(racer_idx).repr,
+                board_len,
+                end_tile,
             )
             return False
         return True
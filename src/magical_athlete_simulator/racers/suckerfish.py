@@ -83,7 +83,9 @@ class SuckerfishRide(Ability):
             return "skip_trigger"
 
         engine.log_info(
-            f"Suckerfish rides the wake of {engine.get_racer(event.target_racer_idx).repr} to {target_tile}!",
+            "Suckerfish rides the wake of %s to %s!",
+            engine.get_racer(event.target_racer_idx).repr,
+            target_tile,
         )
 
         # 1. Attach the target lock
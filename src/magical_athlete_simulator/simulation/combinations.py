@@ -7,7 +7,10 @@ import random
 from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
-from magical_athlete_simulator.simulation.hashing import GameConfiguration
+from magical_athlete_simulator.simulation.hashing import (
+    GameConfiguration,
+    config_fingerprint,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
@@ -103,6 +106,13 @@ def get_combination_at_index(n: int, k: int, index: int) -> list[int]:
 # -------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class GenerationStats:
+    """Counters filled in while `generate_combinations` runs."""
+
+    skipped_seen: int = 0
+
+
 @dataclass(frozen=True)
 class TaskBucket:
     board: BoardName
@@ -119,10 +129,16 @@ def generate_combinations(
     max_total_runs: int | None,
     filters: list[CombinationFilter] | None = None,
     seed_offset: int = 0,
+    seen: set[int] | None = None,
+    stats: GenerationStats | None = None,
 ) -> Iterator[GameConfiguration]:
     """
     Smart generator that guarantees unique combinations even in massive spaces
     by sampling indices instead of racers.
+
+    If `seen` (config fingerprints) is given, already known configurations are
+    skipped here instead of being yielded, and yielded ones are added to it.
+    Skips are counted in `stats`.
     """
     n_racers = len(eligible_racers)
     n_seeds = runs_per_combination or 1
@@ -165,10 +181,14 @@ def generate_combinations(
     execution_order = list(final_buckets)
     random.shuffle(execution_order)
 
+    filter_masks = _compile_filters(filters or [], eligible_racers, boards)
+
     for bucket in execution_order:
         if bucket.num_to_draw == 0:
             continue
 
+        board_filter_masks = filter_masks[bucket.board]
+
         # KEY OPTIMIZATION:
         # Instead of generating racers, we generate integer Indices.
         # random.sample on a range is O(k) memory, not O(N).
@@ -197,32 +217,12 @@ def generate_combinations(
             ]
 
             # --- FILTER CHECK START ---
-            if filters:
-                # Convert list to set for O(1) subset checks
-                current_racers_set = set(selected_racers)
-                should_skip = False
-
-                for f in filters:
-                    # 1. Check Board Match
-                    # If filter.boards is set, current bucket.board must be in it.
-                    # If filter.boards is empty, it applies to ALL boards.
-                    board_match = (not f.boards) or (bucket.board in f.boards)
-
-                    if not board_match:
-                        continue
-
-                    # 2. Check Racer Match
-                    # If filter.racers is set, current racers must contain ALL of them (subset).
-                    # If filter.racers is empty, it applies to ANY combination.
-                    racer_match = (not f.racers) or f.racers.issubset(
-                        current_racers_set,
-                    )
-
-                    if racer_match:
-                        should_skip = True
-                        break
-
-                if should_skip:
+            if board_filter_masks:
+                team_mask = 0
+                for i in racer_indices:
+                    team_mask |= 1 << i
+                # A filter matches when the team contains ALL of its racers
+                if any(team_mask & mask == mask for mask in board_filter_masks):
                     continue
             # --- FILTER CHECK END ---
 
@@ -235,13 +235,53 @@ def generate_combinations(
             rng = random.Random(final_seed)
             rng.shuffle(selected_racers)
 
-            yield GameConfiguration(
+            game_config = GameConfiguration(
                 racers=tuple(selected_racers),
                 board=bucket.board,
                 seed=final_seed,
             )
+            # Skipped configs still consume a seed so resumed runs stay reproducible
             global_yield_counter += 1
 
+            if seen is not None:
+                fingerprint = config_fingerprint(game_config.compute_hash())
+                if fingerprint in seen:
+                    if stats is not None:
+                        stats.skipped_seen += 1
+                    continue
+                seen.add(fingerprint)
+
+            yield game_config
+
+
+def _compile_filters(
+    filters: list[CombinationFilter],
+    eligible_racers: list[RacerName],
+    boards: list[BoardName],
+) -> dict[BoardName, list[int]]:
+    """
+    Precompiles exclusion filters into racer bitmasks per board.
+
+    Bit i stands for eligible_racers[i]; an empty filter.racers compiles to 0,
+    which matches every team. Filters naming an ineligible racer can never
+    match and are dropped.
+    """
+    racer_bits = {name: 1 << i for i, name in enumerate(eligible_racers)}
+    masks: dict[BoardName, list[int]] = {board: [] for board in boards}
+
+    for f in filters:
+        if not f.racers <= racer_bits.keys():
+            continue
+        mask = 0
+        for name in f.racers:
+            mask |= racer_bits[name]
+        # If filter.boards is empty, it applies to ALL boards.
+        for board in boards:
+            if not f.boards or board in f.boards:
+                masks[board].append(mask)
+
+    return masks
+
 
 def _distribute_budget(
     buckets: list[TaskBucket],
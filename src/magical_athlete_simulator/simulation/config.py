@@ -9,6 +9,9 @@ import msgspec
 
 from magical_athlete_simulator.core.types import BoardName, RacerName
 
+_ALL_RACERS: tuple[RacerName, ...] = get_args(RacerName)
+_ALL_RACER_SET: frozenset[RacerName] = frozenset(_ALL_RACERS)
+
 
 class CombinationFilter(msgspec.Struct):
     """
@@ -18,11 +21,11 @@ class CombinationFilter(msgspec.Struct):
 
     # The game must contain ALL of these racers to match this filter.
     # Empty set = Matches any racer combination.
-    racers: set[RacerName] = msgspec.field(default_factory=set)
+    racers: frozenset[RacerName] = msgspec.field(default_factory=frozenset)
 
     # The game must be on ONE of these boards to match this filter.
     # Empty set = Matches any board.
-    boards: set[BoardName] = msgspec.field(default_factory=set)
+    boards: frozenset[BoardName] = msgspec.field(default_factory=frozenset)
 
 
 class SimulationConfig(msgspec.Struct):
@@ -57,20 +60,17 @@ class SimulationConfig(msgspec.Struct):
 
     def get_eligible_racers(self) -> list[RacerName]:
         """Resolve final list of racers based on include/exclude."""
-        # Imports inside method to avoid top-level circular dependencies if any
-
-        all_racers: list[RacerName] = list(get_args(RacerName))
-
         # Start with allow-list or all
         if self.include_racers:
             eligible: list[RacerName] = [
-                r for r in self.include_racers if r in all_racers
+                r for r in self.include_racers if r in _ALL_RACER_SET
             ]
         else:
-            eligible = all_racers
+            eligible = list(_ALL_RACERS)
 
         # Apply block-list
         if self.exclude_racers:
-            eligible = [r for r in eligible if r not in self.exclude_racers]
+            excluded = set(self.exclude_racers)
+            eligible = [r for r in eligible if r not in excluded]
 
         return eligible
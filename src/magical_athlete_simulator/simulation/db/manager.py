@@ -4,32 +4,64 @@ from __future__ import annotations
 
 import atexit
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 import pyarrow as pa
+from sqlalchemy.schema import CreateTable
 from sqlmodel import SQLModel, create_engine
 from tqdm import tqdm
 
+from magical_athlete_simulator.simulation.telemetry import (
+    empty_position_columns,
+    empty_result_columns,
+)
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
-    from magical_athlete_simulator.simulation.db.models import (
-        Race,
-        RacerResult,
+    from magical_athlete_simulator.simulation.db.models import Race
+    from magical_athlete_simulator.simulation.telemetry import (
+        PositionLogColumns,
+        RacerResultColumns,
     )
-    from magical_athlete_simulator.simulation.telemetry import PositionLogColumns
 
 logger = logging.getLogger("magical_athlete")
 
+# Partitions are short-lived and written during the run: cheap snappy encoding.
+# The final compaction pays for zstd once.
+PARTITION_COPY_OPTIONS = "FORMAT PARQUET, CODEC 'SNAPPY', ROW_GROUP_SIZE 100000"
+COMPACTED_COPY_OPTIONS = "FORMAT PARQUET, CODEC 'ZSTD'"
+
+# Older rows store config_hash as a 64-char SHA-256 hex string; its first 32
+# characters are exactly the 16-byte digest used now.
+LEGACY_HASH_PROJECTION = "* REPLACE (unhex(left(config_hash, 32)) AS config_hash)"
+
+# Bound on races waiting for the writer thread; producers block when it fills up.
+WRITER_QUEUE_SIZE = 1024
+
+_STOP = object()
+
 
 class SimulationDatabase:
     """
     Manages persistence of race simulations using a persistent DuckDB file.
 
     Workflow:
-    1. Startup: Checks for 'simulation.duckdb'. If missing, imports from Parquet.
-    2. Run: Writes to 'simulation.duckdb' (Fast, ACID, Single Source of Truth).
-    3. Exit: Exports 'simulation.duckdb' back to Parquet files.
+    1. Startup: Checks for 'simulation.duckdb'. If missing, imports from Parquet
+       (compacted files plus any leftover partitions).
+    2. Run: Batches are bulk-inserted into 'simulation.duckdb'
+       (Fast, ACID, Single Source of Truth).
+    3. Flush: Periodically writes only the rows saved since the last flush to
+       append-only partitions, e.g. 'races/part-*.parquet'.
+    4. Exit: Compacts everything into single Parquet files and drops the partitions.
+
+    With `start_writer()`, races are handed over via `submit()` and steps 2-3
+    run on a background thread so the simulation loop never waits on IO.
     """
 
     def __init__(self, results_dir: Path):
@@ -41,6 +73,17 @@ class SimulationDatabase:
         self.results_parquet = results_dir / "racer_results.parquet"
         self.positions_parquet = results_dir / "race_positions.parquet"
 
+        # (table, compacted parquet file, partition directory)
+        self._tables: tuple[tuple[str, Path, Path], ...] = (
+            ("races", self.races_parquet, results_dir / "races"),
+            ("racer_results", self.results_parquet, results_dir / "racer_results"),
+            (
+                "race_position_logs",
+                self.positions_parquet,
+                results_dir / "race_positions",
+            ),
+        )
+
         # 1. SQLAlchemy Engine (For Schema Management)
         self.engine = create_engine(f"duckdb:///{self.db_path}")
 
@@ -49,27 +92,100 @@ class SimulationDatabase:
 
         self._init_db()
 
-        # Buffers
-        self._race_buffer: list[dict] = []
-        self._result_buffer: list[dict] = []
-        self._position_buffer_cols: PositionLogColumns = {
-            "config_hash": [],
-            "turn_index": [],
-            "current_racer_id": [],
-            "pos_r0": [],
-            "pos_r1": [],
-            "pos_r2": [],
-            "pos_r3": [],
-            "pos_r4": [],
-            "pos_r5": [],
-        }
-
-        # Ensure we export on script exit
-        atexit.register(self.export_parquet)
+        # Races saved to DuckDB but not yet written to a Parquet partition
+        self._unexported_hashes: list[bytes] = []
+        self._run_id: int = int(time.time())
+        self._part_counter: int = 0
+
+        # Serializes all DuckDB writes (writer thread vs. direct callers)
+        self._write_lock: threading.Lock = threading.Lock()
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._writer: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        self._closed: bool = False
+
+        # Ensure we compact on script exit
+        atexit.register(self.close)
+
+    def start_writer(self, batch_size: int, flush_every_batches: int):
+        """Start the background thread that persists `submit()`-ted races."""
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            args=(batch_size, flush_every_batches),
+            name="simulation-db-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def submit(
+        self,
+        race: Race,
+        results: RacerResultColumns,
+        positions: PositionLogColumns,
+    ):
+        """Queue one finished race for the writer thread."""
+        if self._writer_error is not None:
+            msg = "Simulation database writer failed"
+            raise RuntimeError(msg) from self._writer_error
+        self._queue.put((race, results, positions))
+
+    def _writer_loop(self, batch_size: int, flush_every_batches: int):
+        batches_since_flush = 0
+        stopping = False
+        while not stopping:
+            races: list[Race] = []
+            results = empty_result_columns()
+            positions = empty_position_columns()
+
+            # Block for the first item, then drain up to a full batch
+            while len(races) < batch_size:
+                item = self._queue.get()
+                if item is _STOP:
+                    stopping = True
+                    break
+                race, race_results, race_positions = item  # pyright: ignore[reportGeneralTypeIssues]
+                races.append(race)
+                for key, values in race_results.items():
+                    results[key].extend(values)
+                for key, values in race_positions.items():
+                    positions[key].extend(values)
+
+            if self._writer_error is not None or not races:
+                # Keep draining after a failure so producers never block forever
+                continue
+
+            try:
+                self.save_simulations(races, results, positions)
+                batches_since_flush += 1
+                if batches_since_flush >= flush_every_batches:
+                    tqdm.write("💾 Flushing new records to Parquet partitions...")
+                    self.flush()
+                    batches_since_flush = 0
+            except Exception as e:  # noqa: BLE001
+                self._writer_error = e
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run the enclosed statements as one explicit DuckDB transaction.
+
+        The raw connection autocommits every statement on its own otherwise,
+        so a batch would be committed (and could half-fail) table by table.
+        """
+        self.raw_conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            self.raw_conn.execute("ROLLBACK")
+            raise
+        self.raw_conn.execute("COMMIT")
 
     def _init_db(self):
         """Initialize tables. Import existing Parquet if DB is fresh."""
         SQLModel.metadata.create_all(self.engine)
+        self._migrate_legacy_hashes()
 
         try:
             # Check if we have data
@@ -79,146 +195,228 @@ class SimulationDatabase:
         except Exception:  # noqa: BLE001
             self._import_existing_parquet()
 
+    def _migrate_legacy_hashes(self):
+        """
+        Convert tables that still store config_hash as a 64-char hex string.
+
+        `create_all` never alters existing tables, so a DB written before the
+        hash became a 16-byte BLOB keeps its VARCHAR keys. Each such table is
+        rebuilt with the current schema in one transaction, using the same
+        hash mapping as the Parquet import.
+        """
+        legacy_tables = [
+            table
+            for table, _, _ in self._tables
+            if self._hash_column_type(table) == "VARCHAR"
+        ]
+        if not legacy_tables:
+            return
+
+        tqdm.write("📦 Legacy DB detected. Converting config hashes...")
+        try:
+            with self.transaction():
+                for table in legacy_tables:
+                    legacy = f"legacy_{table}"
+                    create = CreateTable(SQLModel.metadata.tables[table])
+                    self.raw_conn.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+                    self.raw_conn.execute(str(create.compile(self.engine)))
+                    self.raw_conn.execute(
+                        f"INSERT INTO {table} SELECT {LEGACY_HASH_PROJECTION} FROM {legacy}",  # noqa: S608
+                    )
+                    self.raw_conn.execute(f"DROP TABLE {legacy}")
+            tqdm.write("✅ Conversion complete.")
+        except Exception:
+            logger.exception("Failed to convert legacy config hashes")
+            raise
+
+    def _hash_column_type(self, table: str) -> str | None:
+        row = self.raw_conn.execute(
+            "SELECT data_type FROM information_schema.columns WHERE table_name = ? AND column_name = 'config_hash'",
+            [table],
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _parquet_sources(self, compacted: Path, parts_dir: Path) -> list[str]:
+        """All parquet files holding rows of one table."""
+        sources = [str(compacted)] if compacted.exists() else []
+        sources.extend(str(p) for p in sorted(parts_dir.glob("part-*.parquet")))
+        return sources
+
+    def _hash_projection(self, source: str) -> str:
+        """
+        Select list for importing a parquet file.
+
+        Older files store config_hash as a 64-char SHA-256 hex string; its first
+        32 characters are exactly the 16-byte digest used now.
+        """
+        hash_type = self.raw_conn.execute(
+            f"SELECT typeof(config_hash) FROM read_parquet('{source}') LIMIT 1",  # noqa: S608
+        ).fetchone()
+        if hash_type is not None and hash_type[0] == "VARCHAR":
+            return LEGACY_HASH_PROJECTION
+        return "*"
+
     def _import_existing_parquet(self):
-        """Load legacy parquet files into the active DuckDB instance."""
-        if not self.races_parquet.exists():
+        """Load parquet files (compacted + partitions) into the active DuckDB instance."""
+        races_sources = self._parquet_sources(self._tables[0][1], self._tables[0][2])
+        if not races_sources:
             return
 
         tqdm.write("📦 Fresh DB detected. Importing existing Parquet history...")
         try:
-            if self.races_parquet.exists():
-                self.raw_conn.execute(
-                    f"INSERT INTO races SELECT * FROM read_parquet('{self.races_parquet}')",  # noqa: S608
-                )
-            if self.results_parquet.exists():
-                self.raw_conn.execute(
-                    f"INSERT INTO racer_results SELECT * FROM read_parquet('{self.results_parquet}')",  # noqa: S608
-                )
-            if self.positions_parquet.exists():
-                self.raw_conn.execute(
-                    f"INSERT INTO race_position_logs SELECT * FROM read_parquet('{self.positions_parquet}')",  # noqa: S608
-                )
-            self.raw_conn.commit()
+            with self.transaction():
+                for table, compacted, parts_dir in self._tables:
+                    for source in self._parquet_sources(compacted, parts_dir):
+                        # OR IGNORE: an interrupted compaction may leave rows in both
+                        self.raw_conn.execute(
+                            f"INSERT OR IGNORE INTO {table} SELECT {self._hash_projection(source)} FROM read_parquet('{source}')",  # noqa: S608
+                        )
             tqdm.write("✅ Import complete.")
         except Exception:
             logger.exception("Failed to import existing parquet")
-            self.raw_conn.rollback()
             raise
 
-    def get_known_hashes(self) -> set[str]:
+    def get_known_hashes(self) -> set[bytes]:
         """
         Fast hash lookup directly from DuckDB.
         This is our Source of Truth during execution.
+
+        The column is fetched as a single Arrow array instead of one Python
+        row tuple per race.
         """
         try:
-            cur = self.raw_conn.cursor()
-            res = cur.execute("SELECT config_hash FROM races").fetchall()
-            return {r[0] for r in res}
+            table = self.raw_conn.execute(
+                "SELECT config_hash FROM races",
+            ).to_arrow_table()
+            return set(table.column("config_hash").to_pylist())
         except Exception:  # noqa: BLE001
             return set()
 
-    def save_simulation(
+    def save_simulations(
         self,
-        race: Race,
-        results: list[RacerResult],
+        races: list[Race],
+        results: RacerResultColumns,
         positions: PositionLogColumns,
     ):
-        """Buffer data in memory."""
-        self._race_buffer.append(race.model_dump())
-        self._result_buffer.extend([r.model_dump() for r in results])
-
-        for key in self._position_buffer_cols:
-            self._position_buffer_cols[key].extend(positions[key])
-
-    def flush_to_parquet(self):
         """
-        Flushes buffers to DuckDB using PyArrow for high-speed bulk ingestion.
+        Bulk-insert a batch of races into DuckDB in a single transaction.
+
+        Each table is converted to an Arrow table and inserted with one
+        `INSERT ... SELECT`, avoiding per-row ORM overhead entirely.
         """
-        if not self._race_buffer and not self._position_buffer_cols["config_hash"]:
+        if not races:
             return
 
+        with self._write_lock:
+            self._insert_batch(races, results, positions)
+            self._unexported_hashes.extend(r.config_hash for r in races)
+
+    def _insert_batch(
+        self,
+        races: list[Race],
+        results: RacerResultColumns,
+        positions: PositionLogColumns,
+    ):
         try:
-            # --- 1. RACES (Metadata) ---
-            # These are usually small enough that row-processing is "fine",
-            # but let's be consistent and fast.
-            if self._race_buffer:
-                # Convert list of dicts -> Arrow Table
-                table = pa.Table.from_pylist(self._race_buffer)
-
-                # Register as a temporary view in DuckDB
+            with self.transaction():
+                # --- 1. RACES (Metadata) ---
+                table = pa.Table.from_pylist([r.model_dump() for r in races])
                 self.raw_conn.register("temp_races_buffer", table)
-
-                # Bulk Insert
                 self.raw_conn.execute(
                     "INSERT OR IGNORE INTO races SELECT * FROM temp_races_buffer",
                 )
-
-                # Cleanup
                 self.raw_conn.unregister("temp_races_buffer")
 
-            # --- 2. RESULTS ---
-            if self._result_buffer:
-                table = pa.Table.from_pylist(self._result_buffer)
-                self.raw_conn.register("temp_results_buffer", table)
-                self.raw_conn.execute(
-                    "INSERT OR IGNORE INTO racer_results SELECT * FROM temp_results_buffer",
-                )
-                self.raw_conn.unregister("temp_results_buffer")
+                # --- 2. RESULTS ---
+                # Columnar like the positions: no per-racer model objects at all.
+                if results["config_hash"]:
+                    table = pa.Table.from_pydict(dict(results))
+                    self.raw_conn.register("temp_results_buffer", table)
+                    self.raw_conn.execute(
+                        "INSERT OR IGNORE INTO racer_results SELECT * FROM temp_results_buffer",
+                    )
+                    self.raw_conn.unregister("temp_results_buffer")
+
+                # --- 3. POSITIONS (The Big One) ---
+                # Already columnar (dict of lists), so Arrow needs no row conversion.
+                if positions["config_hash"]:
+                    table = pa.Table.from_pydict(dict(positions))
+                    self.raw_conn.register("temp_pos_buffer", table)
+                    self.raw_conn.execute(
+                        "INSERT OR IGNORE INTO race_position_logs SELECT * FROM temp_pos_buffer",
+                    )
+                    self.raw_conn.unregister("temp_pos_buffer")
 
-            # --- 3. POSITIONS (The Big One) ---
-            # Your buffer is ALREADY columnar (dict of lists).
-            # PyArrow loves this. No zip() or looping required.
-            if self._position_buffer_cols["config_hash"]:
-                # Ensure the dict is clean for Arrow
-                # (pa.Table.from_pydict is incredibly fast)
-                table = pa.Table.from_pydict(self._position_buffer_cols)
-
-                self.raw_conn.register("temp_pos_buffer", table)
+        except Exception:
+            logger.exception("Failed to save simulation batch")
+            raise
 
-                # Bulk insert millions of rows in milliseconds
+    def flush(self):
+        """Write rows saved since the last flush to new Parquet partitions."""
+        with self._write_lock:
+            if not self._unexported_hashes:
+                return
+            self._flush_batch_to_parquet(f"{self._run_id}-{self._part_counter:05d}")
+            self._part_counter += 1
+            self._unexported_hashes.clear()
+
+    def _flush_batch_to_parquet(self, batch_id: str):
+        """Append-only export: O(batch) IO instead of rewriting whole tables."""
+        hashes = pa.table(
+            {"config_hash": pa.array(self._unexported_hashes, pa.binary())},
+        )
+        self.raw_conn.register("temp_unexported_hashes", hashes)
+        try:
+            for table, _, parts_dir in self._tables:
+                parts_dir.mkdir(exist_ok=True)
+                part_file = parts_dir / f"part-{batch_id}.parquet"
                 self.raw_conn.execute(
-                    "INSERT OR IGNORE INTO race_position_logs SELECT * FROM temp_pos_buffer",
+                    f"COPY (SELECT * FROM {table} WHERE config_hash IN (SELECT config_hash FROM temp_unexported_hashes)) TO '{part_file}' ({PARTITION_COPY_OPTIONS})",  # noqa: S608
                 )
-
-                self.raw_conn.unregister("temp_pos_buffer")
-
-            # Commit
-            self.raw_conn.commit()
-
         except Exception:
-            logger.exception("Failed to flush to DB")
-            # If Arrow conversion fails, you might want to log the specific data causing it
+            logger.exception("Failed to flush batch to parquet")
             raise
+        finally:
+            self.raw_conn.unregister("temp_unexported_hashes")
 
-        # Clear buffers
-        self._race_buffer.clear()
-        self._result_buffer.clear()
-        for key in self._position_buffer_cols:
-            self._position_buffer_cols[key].clear()
-
-    def export_parquet(self):
+    def compact(self):
         """
-        Export the current state of DuckDB to Parquet files.
+        Merge everything into single Parquet files and remove the partitions.
+
+        DuckDB already holds every row (partitions are only a delta log of it),
+        so compaction is one full export per table.
         """
-        tqdm.write("📦 Exporting simulation data to Parquet...")
-        try:
-            self.raw_conn.execute(
-                f"COPY races TO '{self.races_parquet}' (FORMAT PARQUET, CODEC 'ZSTD')",
-            )
-            self.raw_conn.execute(
-                f"COPY racer_results TO '{self.results_parquet}' (FORMAT PARQUET, CODEC 'ZSTD')",
-            )
-            self.raw_conn.execute(
-                f"COPY race_position_logs TO '{self.positions_parquet}' (FORMAT PARQUET, CODEC 'ZSTD')",
-            )
-            tqdm.write("✅ Export complete.")
-        except Exception:
-            logger.exception("Failed to export parquet")
-            raise
+        tqdm.write("📦 Compacting simulation data to Parquet...")
+        with self._write_lock:
+            try:
+                for table, compacted, _ in self._tables:
+                    self.raw_conn.execute(
+                        f"COPY {table} TO '{compacted}' ({COMPACTED_COPY_OPTIONS})",
+                    )
+                for _, _, parts_dir in self._tables:
+                    for part in parts_dir.glob("part-*.parquet"):
+                        part.unlink()
+                tqdm.write("✅ Compaction complete.")
+            except Exception:
+                logger.exception("Failed to compact parquet")
+                raise
+            self._unexported_hashes.clear()
 
     def close(self):
-        """Flush remaining buffers, export, and close."""
-        self.flush_to_parquet()
-        self.export_parquet()
-        self.raw_conn.close()
-        self.engine.dispose()
+        """Drain the writer thread, compact to Parquet and close."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            if self._writer is not None:
+                self._queue.put(_STOP)
+                self._writer.join()
+                self._writer = None
+            self.compact()
+        finally:
+            self.raw_conn.close()
+            self.engine.dispose()
+        if self._writer_error is not None:
+            msg = "Simulation database writer failed"
+            raise RuntimeError(msg) from self._writer_error
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import datetime
+import sys
+from typing import get_args
 
-from sqlmodel import JSON, Column, Field, SQLModel, String
+from sqlmodel import JSON, Column, Field, LargeBinary, SQLModel, String
 
 # we can't put this into type checking block because SQLModel needs to use it
-from magical_athlete_simulator.core.types import ErrorCode  # noqa: TC001
+from magical_athlete_simulator.core.types import (
+    BoardName,
+    ErrorCode,
+    RacerName,
+)
+
+# Racer and board names repeat in every row; map each to one shared string
+# object. Names unpickled from worker processes are fresh copies otherwise.
+INTERNED_NAMES: dict[str, str] = {
+    name: sys.intern(name) for name in (*get_args(RacerName), *get_args(BoardName))
+}
 
 
 class Race(SQLModel, table=True):
@@ -18,8 +30,8 @@ class Race(SQLModel, table=True):
 
     __tablename__ = "races"  # pyright: ignore[reportAssignmentType, reportUnannotatedClassAttribute]
 
-    # Primary Key
-    config_hash: str = Field(primary_key=True)
+    # Primary Key (16-byte digest, see GameConfiguration.compute_hash)
+    config_hash: bytes = Field(primary_key=True, sa_type=LargeBinary)
     config_encoded: str
 
     # Configuration Details
@@ -48,7 +60,7 @@ class RacerResult(SQLModel, table=True):
     __tablename__ = "racer_results"  # pyright: ignore[reportAssignmentType, reportUnannotatedClassAttribute]
 
     # Composite Primary Key
-    config_hash: str = Field(primary_key=True)
+    config_hash: bytes = Field(primary_key=True, sa_type=LargeBinary)
     racer_id: int = Field(primary_key=True)
 
     # Racer Identity
@@ -84,7 +96,7 @@ class RacePositionLog(SQLModel, table=True):
 
     __tablename__ = "race_position_logs"  # pyright: ignore[reportAssignmentType, reportUnannotatedClassAttribute]
 
-    config_hash: str = Field(primary_key=True)
+    config_hash: bytes = Field(primary_key=True, sa_type=LargeBinary)
     turn_index: int = Field(primary_key=True)
 
     current_racer_id: int
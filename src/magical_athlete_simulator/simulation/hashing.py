@@ -12,8 +12,20 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from magical_athlete_simulator.core.types import BoardName, RacerName
 
+CONFIG_HASH_BYTES = 16
 
-@dataclass
+
+def config_fingerprint(config_hash: bytes) -> int:
+    """
+    64-bit integer key for in-memory dedup sets.
+
+    Small ints hash trivially and take less memory per set entry than `bytes`.
+    A collision only means one extra race is skipped.
+    """
+    return int.from_bytes(config_hash[:8], "little")
+
+
+@dataclass(frozen=True)
 class GameConfiguration:
     """Immutable representation of a single game setup."""
 
@@ -25,10 +37,10 @@ class GameConfiguration:
     def repr(self) -> str:
         return f"{self.racers} on {self.board} (Seed: {self.seed}) - {self.encoded}"
 
-    def compute_hash(self) -> str:
-        """Compute stable SHA-256 hash of this configuration."""
-        # Canonical JSON representation (sorted keys, no whitespace)
-        canonical = json.dumps(
+    @cached_property
+    def _canonical(self) -> bytes:
+        """Canonical JSON representation (sorted keys, no whitespace)."""
+        return json.dumps(
             {
                 "racers": list(self.racers),
                 "board": self.board,
@@ -36,23 +48,26 @@ class GameConfiguration:
             },
             sort_keys=True,
             separators=(",", ":"),
-        )
+        ).encode("utf-8")
+
+    @cached_property
+    def _digest(self) -> bytes:
+        return hashlib.sha256(self._canonical).digest()[:CONFIG_HASH_BYTES]
+
+    def compute_hash(self) -> bytes:
+        """
+        Compute stable 16-byte hash of this configuration.
 
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        This is the SHA-256 digest truncated to 16 bytes, so it matches the first
+        32 characters of the hex hashes stored by older versions. Computed once
+        per instance (the CLI and the runner both ask for it).
+        """
+        return self._digest
 
     @cached_property
     def encoded(self) -> str:
         """Shareable config string for URLs/frontend."""
-        canonical = json.dumps(
-            {
-                "racers": list(self.racers),
-                "board": self.board,
-                "seed": self.seed,
-            },
-            sort_keys=True,
-            separators=(",", ":"),
-        )
-        return base64.urlsafe_b64encode(canonical.encode("utf-8")).decode("ascii")
+        return base64.urlsafe_b64encode(self._canonical).decode("ascii")
 
     @classmethod
     def from_encoded(cls, encoded: str) -> GameConfiguration:
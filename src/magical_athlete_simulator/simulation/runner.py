@@ -3,48 +3,62 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from tqdm import tqdm  # Added for logging
-
 from magical_athlete_simulator.engine.board import BOARD_DEFINITIONS
 from magical_athlete_simulator.engine.scenario import GameScenario, RacerConfig
 from magical_athlete_simulator.simulation.telemetry import (
     MetricsAggregator,
-    PositionLogColumns,
+    empty_position_columns,
+    empty_result_columns,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from magical_athlete_simulator.core.events import GameEvent
     from magical_athlete_simulator.core.types import ErrorCode
     from magical_athlete_simulator.engine.game_engine import GameEngine
-    from magical_athlete_simulator.simulation.db.models import RacerResult
     from magical_athlete_simulator.simulation.hashing import GameConfiguration
+    from magical_athlete_simulator.simulation.telemetry import (
+        PositionLogColumns,
+        RacerResultColumns,
+    )
 
 
 @dataclass(slots=True)
 class SimulationResult:
     """Result of a single race simulation."""
 
-    config_hash: str
+    config_hash: bytes
     timestamp: float
     execution_time_ms: float
     error_code: ErrorCode | None
     turn_count: int
-    metrics: list[RacerResult]
+    metrics: RacerResultColumns
     position_logs: PositionLogColumns
+    # Console lines for the caller to print (races may run in worker processes)
+    log_lines: list[str] = field(default_factory=list)
 
 
 def run_single_simulation(
     config: GameConfiguration,
     max_turns: int,
+    *,
+    verbose: bool = False,
 ) -> SimulationResult:
     """
     Execute one race and return aggregated metrics.
+
+    Errors are always reported in `log_lines`; per-race start/finish lines only
+    when `verbose`.
     """
+    log_lines: list[str] = []
+
     # --- START LOGGING ---
-    tqdm.write(f"▶ Simulating: {config.repr}")
+    if verbose:
+        log_lines.append(f"▶ Simulating: {config.repr}")
 
     start_time = time.perf_counter()
     timestamp = time.time()
@@ -100,42 +114,32 @@ def run_single_simulation(
     execution_time_ms = (end_time - start_time) * 1000
 
     if error_code is not None and error_code != "MAX_TURNS_REACHED":
-        tqdm.write(
+        log_lines.append(
             f"⚠️ Error after {turn_counter} turns ({execution_time_ms:.2f}ms) due to {error_code}",
         )
 
     if error_code == "MAX_TURNS_REACHED":
         # STRATEGY: Aborted races are saved in the 'races' table (metadata)
         # but we return EMPTY metrics/logs so nothing is written to the detail tables.
-        metrics = []
-        positions: PositionLogColumns = {
-            "config_hash": [],
-            "turn_index": [],
-            "current_racer_id": [],
-            "pos_r0": [],
-            "pos_r1": [],
-            "pos_r2": [],
-            "pos_r3": [],
-            "pos_r4": [],
-            "pos_r5": [],
-        }
+        metrics = empty_result_columns()
+        positions: PositionLogColumns = empty_position_columns()
     else:
         metrics = aggregator.finalize_metrics(engine)
         positions = aggregator.finalize_positions()
 
-        # --- END LOGGING ---
-        sorted_results = sorted(
-            metrics,
-            key=lambda r: (
-                r.finish_position if r.finish_position else 999,
-                -r.final_vp,
-            ),
+    # --- END LOGGING ---
+    if verbose and error_code != "MAX_TURNS_REACHED":
+        finish = metrics["finish_position"]
+        order = sorted(
+            range(len(metrics["racer_id"])),
+            key=lambda i: (finish[i] or 999, -metrics["final_vp"][i]),
         )
+        names = metrics["racer_name"]
 
-        winner = sorted_results[0].racer_name if len(sorted_results) > 0 else "N/A"
-        runner_up = sorted_results[1].racer_name if len(sorted_results) > 1 else "None"
+        winner = names[order[0]] if len(order) > 0 else "N/A"
+        runner_up = names[order[1]] if len(order) > 1 else "None"
 
-        tqdm.write(
+        log_lines.append(
             f"🏁 Done in {execution_time_ms:.2f}ms | {turn_counter} turns |\n1st: {winner}, 2nd: {runner_up}",
         )
 
@@ -147,4 +151,22 @@ def run_single_simulation(
         turn_count=turn_counter,
         metrics=metrics,
         position_logs=positions,
+        log_lines=log_lines,
     )
+
+
+def run_simulation_batch(
+    configs: Sequence[GameConfiguration],
+    max_turns: int,
+    *,
+    verbose: bool = False,
+) -> list[SimulationResult]:
+    """
+    Run several independent races back to back.
+
+    One process-pool task per batch instead of per race amortizes the task
+    submission and pickling round-trip across all of them.
+    """
+    return [
+        run_single_simulation(config, max_turns, verbose=verbose) for config in configs
+    ]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol, TypedDict
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict
 
 from magical_athlete_simulator.core.events import (
     AbilityTriggeredEvent,
@@ -9,9 +10,10 @@ from magical_athlete_simulator.core.events import (
     RollResultEvent,
     TripRecoveryEvent,
 )
-from magical_athlete_simulator.simulation.db.models import RacerResult
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, MutableSequence
+
     from magical_athlete_simulator.core.events import GameEvent
     from magical_athlete_simulator.core.types import AbilityName, ModifierName
     from magical_athlete_simulator.engine.game_engine import GameEngine
@@ -23,8 +25,11 @@ if TYPE_CHECKING:
 
 
 class LogSource(Protocol):
-    def export_text(self) -> str: ...
     def export_html(self) -> str: ...
+    def line_count(self) -> int: ...
+    def html_snapshot_id(self) -> int:
+        """Monotonic id that changes whenever the exported HTML would."""
+        ...
 
 
 @dataclass(frozen=True, slots=True)
@@ -34,6 +39,8 @@ class SnapshotPolicy:
     fallback_event_name: str = "TurnSkipped/Recovery"
     snapshot_on_turn_end: bool = False
     turn_end_event_name: str = "TurnEnd"
+    # Keep only the most recent N snapshots (None keeps the whole race)
+    max_history: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,18 +48,24 @@ class StepSnapshot:
     global_step_index: int
     turn_index: int
     event_name: str
-    positions: list[int]
-    tripped: list[bool]
-    vp: list[int]
+    positions: tuple[int, ...]
+    tripped: tuple[bool, ...]
+    vp: tuple[int, ...]
     last_roll: int
     current_racer: int
-    names: list[str]
-    modifiers: list[list[AbilityName | ModifierName]]
-    abilities: list[list[AbilityName]]
-    log_html: str
+    names: tuple[str, ...]
+    modifiers: tuple[tuple[AbilityName | ModifierName, ...], ...]
+    abilities: tuple[tuple[AbilityName, ...], ...]
+    # Rendered once per turn: the HTML is the log as of the end of this
+    # snapshot's turn, and log_line_index marks where this step falls in it
+    log_html_version: int
     log_line_index: int
 
 
+def _reuse_if_equal[T](new: T, old: T) -> T:
+    return old if new == old else new
+
+
 @dataclass(slots=True)
 class SnapshotRecorder:
     """
@@ -62,9 +75,46 @@ class SnapshotRecorder:
 
     policy: SnapshotPolicy
     log_source: LogSource
-    step_history: list[StepSnapshot] = field(default_factory=list)
+    step_history: MutableSequence[StepSnapshot] = field(default_factory=list)
+    # Global step indices per turn; see `get_step` once history is bounded
     turn_map: dict[int, list[int]] = field(default_factory=dict)
-    _turn_step_counts: dict[int, int] = field(default_factory=dict)
+    _step_count: int = 0
+    _html_cache: dict[int, str] = field(default_factory=dict)
+    _pending_html: list[int] = field(default_factory=list)
+    # Racer names never change during a race, so every snapshot shares one
+    _names: tuple[str, ...] | None = None
+    # The policy is frozen, so its type filter can be read once up front
+    _snapshot_types: tuple[type[object], ...] = field(init=False, default=())
+    # isinstance answer per concrete event class, so subclasses still match
+    _snapshot_type_hits: dict[type[object], bool] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._snapshot_types = self.policy.snapshot_event_types
+        if self.policy.max_history is not None:
+            if self.policy.max_history < 1:
+                msg = f"max_history must be at least 1, got {self.policy.max_history}"
+                raise ValueError(msg)
+            self.step_history = deque(self.step_history, self.policy.max_history)
+
+    def get_step(self, global_step_index: int) -> StepSnapshot:
+        """Looks up a retained snapshot by the index stored in `turn_map`."""
+        first_retained = self._step_count - len(self.step_history)
+        return self.step_history[global_step_index - first_retained]
+
+    def log_html(self, snapshot: StepSnapshot) -> str:
+        """Returns the log HTML for the snapshot's turn."""
+        if snapshot.log_html_version not in self._html_cache:
+            self.flush_log_html()
+        return self._html_cache[snapshot.log_html_version]
+
+    def flush_log_html(self) -> None:
+        """Renders the log once for every snapshot captured since the last flush."""
+        if not self._pending_html:
+            return
+        html = self.log_source.export_html()
+        for version in self._pending_html:
+            self._html_cache[version] = html
+        self._pending_html.clear()
 
     def on_event(
         self,
@@ -73,19 +123,26 @@ class SnapshotRecorder:
         *,
         turn_index: int,
     ) -> None:
-        if isinstance(event, self.policy.snapshot_event_types):
-            self.capture(engine, event.__class__.__name__, turn_index=turn_index)
+        # Headless runs configure no snapshot types; skip the lookup entirely
+        if not self._snapshot_types:
+            return
+        event_type = type(event)
+        hit = self._snapshot_type_hits.get(event_type)
+        if hit is None:
+            hit = issubclass(event_type, self._snapshot_types)
+            self._snapshot_type_hits[event_type] = hit
+        if hit:
+            self.capture(engine, event_type.__name__, turn_index=turn_index)
 
     def on_turn_end(self, engine: GameEngine, *, turn_index: int) -> None:
         if self.policy.snapshot_on_turn_end:
             self.capture(engine, self.policy.turn_end_event_name, turn_index=turn_index)
 
-        if (
-            self.policy.ensure_snapshot_each_turn
-            and self._turn_step_counts.get(turn_index, 0) == 0
-        ):
+        if self.policy.ensure_snapshot_each_turn and turn_index not in self.turn_map:
             self.capture(engine, self.policy.fallback_event_name, turn_index=turn_index)
 
+        self.flush_log_html()
+
     def capture(
         self,
         engine: GameEngine,
@@ -93,31 +150,83 @@ class SnapshotRecorder:
         *,
         turn_index: int,
     ) -> None:
-        current_logs_text = self.log_source.export_text()
-        log_line_index = max(0, current_logs_text.count("\n") - 1)
-        current_logs_html = self.log_source.export_html()
+        log_line_index = max(0, self.log_source.line_count() - 1)
+        # Rendering waits for flush_log_html at turn end; versions only grow,
+        # so a repeat can only be the last one queued
+        html_version = self.log_source.html_snapshot_id()
+        if html_version not in self._html_cache and (
+            not self._pending_html or self._pending_html[-1] != html_version
+        ):
+            self._pending_html.append(html_version)
+
+        # One pass over the racers, transposed into per-field columns
+        rows = [
+            (
+                r.position,
+                r.tripped,
+                r.victory_points,
+                r.modifier_names(),
+                r.sorted_abilities(),
+            )
+            for r in engine.state.racers
+        ]
+        positions, tripped, vp, modifiers, abilities = zip(*rows, strict=True)
+
+        # Columns are immutable, so any that didn't change since the previous
+        # step are shared with it instead of kept as another copy
+        if self.step_history:
+            prev = self.step_history[-1]
+            positions = _reuse_if_equal(positions, prev.positions)
+            tripped = _reuse_if_equal(tripped, prev.tripped)
+            vp = _reuse_if_equal(vp, prev.vp)
+            modifiers = _reuse_if_equal(modifiers, prev.modifiers)
+            abilities = _reuse_if_equal(abilities, prev.abilities)
+
+        if self._names is None:
+            self._names = tuple(r.name for r in engine.state.racers)
 
         snapshot = StepSnapshot(
-            global_step_index=len(self.step_history),
+            global_step_index=self._step_count,
             turn_index=turn_index,
             event_name=event_name,
-            positions=[r.position for r in engine.state.racers],
-            tripped=[r.tripped for r in engine.state.racers],
-            vp=[r.victory_points for r in engine.state.racers],
+            positions=positions,
+            tripped=tripped,
+            vp=vp,
             last_roll=engine.state.roll_state.base_value,
             current_racer=engine.state.current_racer_idx,
-            names=[r.name for r in engine.state.racers],
-            modifiers=[[m.name for m in r.modifiers] for r in engine.state.racers],
-            abilities=[sorted(r.active_abilities) for r in engine.state.racers],
-            log_html=current_logs_html,
+            names=self._names,
+            modifiers=modifiers,
+            abilities=abilities,
+            log_html_version=html_version,
             log_line_index=log_line_index,
         )
 
+        max_history = self.policy.max_history
+        if max_history is not None and len(self.step_history) == max_history:
+            self._evict_oldest(snapshot)
         self.step_history.append(snapshot)
-        self.turn_map.setdefault(turn_index, []).append(snapshot.global_step_index)
-        self._turn_step_counts[turn_index] = (
-            self._turn_step_counts.get(turn_index, 0) + 1
-        )
+        self._step_count += 1
+        # setdefault would build a throwaway empty list on every capture
+        turn_steps = self.turn_map.get(turn_index)
+        if turn_steps is None:
+            turn_steps = self.turn_map[turn_index] = []
+        turn_steps.append(snapshot.global_step_index)
+
+    def _evict_oldest(self, incoming: StepSnapshot) -> None:
+        evicted = self.step_history[0]
+        # Indices were appended in order, so the oldest sits first in the map
+        oldest_turn = next(iter(self.turn_map))
+        turn_steps = self.turn_map[oldest_turn]
+        turn_steps.pop(0)
+        if not turn_steps:
+            del self.turn_map[oldest_turn]
+        # HTML versions only grow along the history; drop this one unless the
+        # next retained step still shares it
+        successor = self.step_history[1] if len(self.step_history) > 1 else incoming
+        if successor.log_html_version != evicted.log_html_version:
+            self._html_cache.pop(evicted.log_html_version, None)
+            if evicted.log_html_version in self._pending_html:
+                self._pending_html.remove(evicted.log_html_version)
 
 
 # ==============================================================================
@@ -128,7 +237,7 @@ class SnapshotRecorder:
 class PositionLogColumns(TypedDict):
     """Columnar storage for position logs (flat format)."""
 
-    config_hash: list[str]
+    config_hash: list[bytes]
     turn_index: list[int]
     current_racer_id: list[int]
     pos_r0: list[int | None]
@@ -139,77 +248,125 @@ class PositionLogColumns(TypedDict):
     pos_r5: list[int | None]
 
 
+class TurnHistoryColumns(TypedDict):
+    """Columnar storage for the per-turn roll history."""
+
+    turn_index: list[int]
+    racer_idx: list[int]
+    dice_roll: list[int]
+
+
+def empty_turn_history_columns() -> TurnHistoryColumns:
+    return {"turn_index": [], "racer_idx": [], "dice_roll": []}
+
+
+def empty_position_columns() -> PositionLogColumns:
+    return {
+        "config_hash": [],
+        "turn_index": [],
+        "current_racer_id": [],
+        "pos_r0": [],
+        "pos_r1": [],
+        "pos_r2": [],
+        "pos_r3": [],
+        "pos_r4": [],
+        "pos_r5": [],
+    }
+
+
+class RacerResultColumns(TypedDict):
+    """Columnar storage for racer results, in `racer_results` table order."""
+
+    config_hash: list[bytes]
+    racer_id: list[int]
+    racer_name: list[str]
+    final_vp: list[int]
+    turns_taken: list[int]
+    recovery_turns: list[int]
+    skipped_main_moves: list[int]
+    rolling_turns: list[int]
+    sum_dice_rolled: list[int]
+    sum_dice_rolled_final: list[int]
+    ability_trigger_count: list[int]
+    ability_self_target_count: list[int]
+    ability_target_count: list[int]
+    finish_position: list[int | None]
+    eliminated: list[bool]
+    rank: list[int | None]
+
+
+def empty_result_columns() -> RacerResultColumns:
+    return {
+        "config_hash": [],
+        "racer_id": [],
+        "racer_name": [],
+        "final_vp": [],
+        "turns_taken": [],
+        "recovery_turns": [],
+        "skipped_main_moves": [],
+        "rolling_turns": [],
+        "sum_dice_rolled": [],
+        "sum_dice_rolled_final": [],
+        "ability_trigger_count": [],
+        "ability_self_target_count": [],
+        "ability_target_count": [],
+        "finish_position": [],
+        "eliminated": [],
+        "rank": [],
+    }
+
+
 @dataclass(slots=True)
-class TurnRecord:
-    turn_index: int
-    racer_idx: int
-    dice_roll: int
+class RacerStats:
+    """Per-racer counters, mutated during the race and emitted as columns."""
+
+    racer_id: int
+    racer_name: str
+    turns_taken: int = 0
+    recovery_turns: int = 0
+    skipped_main_moves: int = 0
+    rolling_turns: int = 0
+    sum_dice_rolled: int = 0
+    sum_dice_rolled_final: int = 0
+    ability_trigger_count: int = 0
+    ability_self_target_count: int = 0
+    ability_target_count: int = 0
 
 
 @dataclass(slots=True)
 class MetricsAggregator:
     """
     High-performance aggregator for batch simulations.
-    Uses columnar buffering for position logs to avoid object overhead.
+    Uses columnar buffering for turn history and position logs to avoid
+    object overhead.
     """
 
-    config_hash: str
-
-    results: dict[int, RacerResult] = field(default_factory=dict)
-    turn_history: list[TurnRecord] = field(default_factory=list)
-
-    # COLUMNAR BUFFER: Dict of Lists
-    position_logs: PositionLogColumns = field(
-        default_factory=lambda: {
-            "config_hash": [],
-            "turn_index": [],
-            "current_racer_id": [],
-            "pos_r0": [],
-            "pos_r1": [],
-            "pos_r2": [],
-            "pos_r3": [],
-            "pos_r4": [],
-            "pos_r5": [],
-        },
+    config_hash: bytes
+
+    # Indexed by racer idx, which is dense (0..N-1) like engine.state.racers
+    results: list[RacerStats] = field(default_factory=list)
+
+    # COLUMNAR BUFFERS: Dict of Lists
+    turn_history: TurnHistoryColumns = field(
+        default_factory=empty_turn_history_columns,
     )
+    position_logs: PositionLogColumns = field(default_factory=empty_position_columns)
 
     def initialize_racers(self, engine: GameEngine) -> None:
-        for racer in engine.state.racers:
-            self.results[racer.idx] = RacerResult(
-                config_hash=self.config_hash,
-                racer_id=racer.idx,
-                racer_name=racer.name,
-            )
+        self.results = [
+            RacerStats(racer_id=racer.idx, racer_name=racer.name)
+            for racer in engine.state.racers
+        ]
 
-    def _get_result(self, racer_idx: int) -> RacerResult:
+    def _get_result(self, racer_idx: int) -> RacerStats:
         return self.results[racer_idx]
 
     def on_event(self, event: GameEvent) -> None:
-        if isinstance(event, RollResultEvent):
-            racer_metrics = self._get_result(event.target_racer_idx)
-            racer_metrics.sum_dice_rolled += event.base_value
-            racer_metrics.sum_dice_rolled_final += event.final_value
-            racer_metrics.rolling_turns += 1
-
-        if isinstance(event, AbilityTriggeredEvent):
-            stats = self._get_result(event.responsible_racer_idx)
-            stats.ability_trigger_count += 1
-            if event.responsible_racer_idx == event.target_racer_idx:
-                stats.ability_self_target_count += 1
-            if (
-                event.target_racer_idx is not None
-                and event.target_racer_idx != event.responsible_racer_idx
-            ):
-                target_stats = self._get_result(event.target_racer_idx)
-                target_stats.ability_target_count += 1
-
-        if isinstance(event, TripRecoveryEvent):
-            stats = self._get_result(event.target_racer_idx)
-            stats.recovery_turns += 1
-
-        if isinstance(event, MainMoveSkippedEvent):
-            stats = self._get_result(event.responsible_racer_idx)
-            stats.skipped_main_moves += 1
+        # None of the tracked event types are subclassed, so an exact-type
+        # lookup picks the handler and every other event falls straight through
+        handler = _METRIC_HANDLERS.get(type(event))
+        if handler is not None:
+            handler(self, event)
 
     def on_turn_end(
         self,
@@ -229,13 +386,10 @@ class MetricsAggregator:
             roll_val = engine.state.roll_state.base_value
             stats = self._get_result(racer_idx)
             stats.turns_taken += 1
-            self.turn_history.append(
-                TurnRecord(
-                    turn_index=turn_index,
-                    racer_idx=racer_idx,
-                    dice_roll=roll_val,
-                ),
-            )
+            history = self.turn_history
+            history["turn_index"].append(turn_index)
+            history["racer_idx"].append(racer_idx)
+            history["dice_roll"].append(roll_val)
 
         # 2. Capture Positions (FLAT FORMAT - one row per turn)
         cols = self.position_logs
@@ -259,17 +413,75 @@ class MetricsAggregator:
         cols["pos_r4"].append(positions[4])
         cols["pos_r5"].append(positions[5])
 
-    def finalize_metrics(self, engine: GameEngine) -> list[RacerResult]:
-        output: list[RacerResult] = []
-        for racer in engine.state.racers:
-            stats = self._get_result(racer.idx)
-            stats.final_vp = racer.victory_points
-            stats.finish_position = racer.finish_position
-            stats.eliminated = racer.eliminated
-            # Note: 'finished' isn't on RacerResult in your previous schema,
-            # but is used in your frontend snippet. Add if needed.
-            output.append(stats)
-        return output
+    def finalize_metrics(self, engine: GameEngine) -> RacerResultColumns:
+        """Emit one row per racer in columnar form (ranks are left unset)."""
+        # Columns are built in one pass each; results and engine.state.racers
+        # are both indexed by racer idx, so the rows line up
+        racers = engine.state.racers
+        stats = self.results
+        n = len(racers)
+        return {
+            "config_hash": [self.config_hash] * n,
+            "racer_id": [s.racer_id for s in stats],
+            "racer_name": [s.racer_name for s in stats],
+            "final_vp": [r.victory_points for r in racers],
+            "turns_taken": [s.turns_taken for s in stats],
+            "recovery_turns": [s.recovery_turns for s in stats],
+            "skipped_main_moves": [s.skipped_main_moves for s in stats],
+            "rolling_turns": [s.rolling_turns for s in stats],
+            "sum_dice_rolled": [s.sum_dice_rolled for s in stats],
+            "sum_dice_rolled_final": [s.sum_dice_rolled_final for s in stats],
+            "ability_trigger_count": [s.ability_trigger_count for s in stats],
+            "ability_self_target_count": [s.ability_self_target_count for s in stats],
+            "ability_target_count": [s.ability_target_count for s in stats],
+            "finish_position": [r.finish_position for r in racers],
+            "eliminated": [r.eliminated for r in racers],
+            "rank": [None] * n,
+        }
 
     def finalize_positions(self) -> PositionLogColumns:
         return self.position_logs
+
+
+def _record_ability_triggered(
+    metrics: MetricsAggregator,
+    event: AbilityTriggeredEvent,
+) -> None:
+    stats = metrics.results[event.responsible_racer_idx]
+    stats.ability_trigger_count += 1
+    if event.responsible_racer_idx == event.target_racer_idx:
+        stats.ability_self_target_count += 1
+    if (
+        event.target_racer_idx is not None
+        and event.target_racer_idx != event.responsible_racer_idx
+    ):
+        metrics.results[event.target_racer_idx].ability_target_count += 1
+
+
+def _record_roll_result(metrics: MetricsAggregator, event: RollResultEvent) -> None:
+    racer_metrics = metrics.results[event.target_racer_idx]
+    racer_metrics.sum_dice_rolled += event.base_value
+    racer_metrics.sum_dice_rolled_final += event.final_value
+    racer_metrics.rolling_turns += 1
+
+
+def _record_trip_recovery(
+    metrics: MetricsAggregator,
+    event: TripRecoveryEvent,
+) -> None:
+    metrics.results[event.target_racer_idx].recovery_turns += 1
+
+
+def _record_main_move_skipped(
+    metrics: MetricsAggregator,
+    event: MainMoveSkippedEvent,
+) -> None:
+    metrics.results[event.responsible_racer_idx].skipped_main_moves += 1
+
+
+_METRIC_HANDLERS: dict[type[GameEvent], Callable[[MetricsAggregator, Any], None]] = {
+    AbilityTriggeredEvent: _record_ability_triggered,
+    RollResultEvent: _record_roll_result,
+    TripRecoveryEvent: _record_trip_recovery,
+    MainMoveSkippedEvent: _record_main_move_skipped,
+}
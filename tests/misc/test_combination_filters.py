@@ -0,0 +1,56 @@
+import itertools
+import random
+
+from magical_athlete_simulator.simulation.combinations import generate_combinations
+from magical_athlete_simulator.simulation.config import (
+    CombinationFilter,
+    SimulationConfig,
+)
+
+
+def test_filters_skip_every_matching_team():
+    """
+    Scenario: A full batch is generated with racer, board, mixed and
+    ineligible-racer exclusion filters.
+    Verify: No yielded game matches a filter, and every team that matches
+    none of them is still generated.
+    """
+    eligible = SimulationConfig(exclude_racers=["Banana"]).get_eligible_racers()
+    filters = [
+        CombinationFilter(racers=frozenset(eligible[:2])),
+        CombinationFilter(
+            racers=frozenset([eligible[3]]),
+            boards=frozenset(["standard"]),
+        ),
+        CombinationFilter(racers=frozenset(["Banana"])),
+    ]
+
+    random.seed(0)
+    games = list(
+        generate_combinations(
+            eligible_racers=eligible,
+            racer_counts=[2, 3],
+            boards=["standard", "wild_wilds"],
+            runs_per_combination=None,
+            max_total_runs=None,
+            filters=filters,
+        ),
+    )
+
+    def matches(racers: frozenset[str], board: str) -> bool:
+        return any(
+            (not f.boards or board in f.boards) and f.racers <= racers
+            for f in filters
+        )
+
+    assert not any(matches(frozenset(g.racers), g.board) for g in games)
+
+    generated = {(frozenset(g.racers), g.board) for g in games}
+    expected = {
+        (frozenset(team), board)
+        for board in ("standard", "wild_wilds")
+        for k in (2, 3)
+        for team in itertools.combinations(eligible, k)
+        if not matches(frozenset(team), board)
+    }
+    assert generated == expected
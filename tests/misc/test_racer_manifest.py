@@ -0,0 +1,29 @@
+import pkgutil
+from pathlib import Path
+
+import magical_athlete_simulator.racers as racers_pkg
+from magical_athlete_simulator.core.registry import RACER_ABILITIES
+from magical_athlete_simulator.racers import RACER_MODULES, get_ability_classes
+
+
+def test_manifest_lists_every_racer_module():
+    """
+    Scenario: The racer modules are discovered from the racers package on disk.
+    Verify: RACER_MODULES names exactly those modules, so no racer is left out
+    of (or stale in) the explicit import manifest.
+    """
+    on_disk = {
+        name
+        for _, name, _ in pkgutil.iter_modules([str(Path(racers_pkg.__file__).parent)])
+    }
+    assert set(RACER_MODULES) == on_disk
+
+
+def test_every_registered_ability_has_a_class():
+    """
+    Scenario: Ability classes are loaded from the racer manifest.
+    Verify: Every ability listed in RACER_ABILITIES resolves to a class.
+    """
+    classes = get_ability_classes()
+    for abilities in RACER_ABILITIES.values():
+        assert abilities <= classes.keys()
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+pytest.importorskip("duckdb_engine")
+pytest.importorskip("pyarrow")
+# Registers the table models on SQLModel.metadata
+pytest.importorskip("magical_athlete_simulator.simulation.db.models")
+
+from magical_athlete_simulator.simulation.db.manager import (  # noqa: E402
+    SimulationDatabase,
+)
+
+# Schema written by releases that stored config_hash as a SHA-256 hex string
+LEGACY_SCHEMA = """
+CREATE TABLE races(config_hash VARCHAR, config_encoded VARCHAR NOT NULL,
+    seed INTEGER NOT NULL, board VARCHAR NOT NULL, racer_names JSON,
+    racer_count INTEGER NOT NULL, "timestamp" FLOAT NOT NULL,
+    execution_time_ms FLOAT NOT NULL, error_code VARCHAR,
+    total_turns INTEGER NOT NULL, created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY(config_hash));
+CREATE TABLE racer_results(config_hash VARCHAR, racer_id INTEGER,
+    racer_name VARCHAR NOT NULL, final_vp INTEGER NOT NULL,
+    turns_taken INTEGER NOT NULL, recovery_turns INTEGER NOT NULL,
+    skipped_main_moves INTEGER NOT NULL, rolling_turns INTEGER NOT NULL,
+    sum_dice_rolled INTEGER NOT NULL, sum_dice_rolled_final INTEGER NOT NULL,
+    ability_trigger_count INTEGER NOT NULL,
+    ability_self_target_count INTEGER NOT NULL,
+    ability_target_count INTEGER NOT NULL, finish_position INTEGER,
+    eliminated BOOLEAN NOT NULL, rank INTEGER, PRIMARY KEY(config_hash, racer_id));
+CREATE TABLE race_position_logs(config_hash VARCHAR, turn_index INTEGER,
+    current_racer_id INTEGER NOT NULL, pos_r0 INTEGER, pos_r1 INTEGER,
+    pos_r2 INTEGER, pos_r3 INTEGER, pos_r4 INTEGER, pos_r5 INTEGER,
+    PRIMARY KEY(config_hash, turn_index));
+"""
+
+
+def test_resume_from_legacy_hex_hash_db(tmp_path: Path):
+    """
+    Scenario: A results directory holds a simulation.duckdb whose tables still
+    key races by the 64-char hex config hash.
+    Verify: Opening it converts every table to the 16-byte digest in place, so
+    known hashes are bytes and rows stay joined across tables.
+    """
+    hex_hash = "ab" * 32
+    conn = duckdb.connect(str(tmp_path / "simulation.duckdb"))
+    conn.execute(LEGACY_SCHEMA)
+    conn.execute(
+        "INSERT INTO races VALUES (?, 'x', 1, 'standard', '[]', 2, 0, 0, NULL, 3, now())",
+        [hex_hash],
+    )
+    conn.execute(
+        "INSERT INTO racer_results VALUES (?, 0, 'Banana', 1, 3, 0, 0, 3, 9, 9, 0, 0, 0, 1, false, 1)",
+        [hex_hash],
+    )
+    conn.execute(
+        "INSERT INTO race_position_logs VALUES (?, 1, 0, 4, 2, NULL, NULL, NULL, NULL)",
+        [hex_hash],
+    )
+    conn.close()
+
+    db = SimulationDatabase(tmp_path)
+    try:
+        digest = bytes.fromhex(hex_hash)[:16]
+        assert db.get_known_hashes() == {digest}
+        for table in ("racer_results", "race_position_logs"):
+            row = db.raw_conn.execute(
+                f"SELECT count(*) FROM {table} JOIN races USING (config_hash)",  # noqa: S608
+            ).fetchone()
+            assert row == (1,)
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+from magical_athlete_simulator.core.events import MoveCmdEvent
+from magical_athlete_simulator.engine.scenario import GameScenario, RacerConfig
+from magical_athlete_simulator.simulation.telemetry import (
+    SnapshotPolicy,
+    SnapshotRecorder,
+)
+
+
+class CountingLogSource:
+    """Stands in for a recording console: one new log line per call."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+
+    def export_html(self) -> str:
+        return f"<log {self.lines}>"
+
+    def line_count(self) -> int:
+        self.lines += 1
+        return self.lines
+
+    def html_snapshot_id(self) -> int:
+        return self.lines
+
+
+def _record(max_history: int | None) -> SnapshotRecorder:
+    game = GameScenario(
+        [
+            RacerConfig(0, "Centaur"),
+            RacerConfig(1, "Scoocher"),
+            RacerConfig(2, "Banana"),
+        ],
+        seed=7,
+    )
+    recorder = SnapshotRecorder(
+        policy=SnapshotPolicy(
+            snapshot_event_types=(MoveCmdEvent,),
+            max_history=max_history,
+        ),
+        log_source=CountingLogSource(),
+    )
+    turn = {"index": 1}
+    game.engine.on_event_processed = lambda engine, event: recorder.on_event(
+        engine,
+        event,
+        turn_index=turn["index"],
+    )
+    for _ in range(20):
+        game.run_turn()
+        recorder.on_turn_end(game.engine, turn_index=turn["index"])
+        turn["index"] += 1
+    return recorder
+
+
+def test_bounded_history_keeps_latest_snapshots():
+    """
+    Scenario: The same seeded race is recorded with and without a history bound.
+    Verify: The bounded recorder keeps exactly the newest snapshots, and its
+    turn map and HTML cache only reference what is still retained.
+    """
+    full = _record(max_history=None)
+    bounded = _record(max_history=5)
+
+    assert len(full.step_history) > 5
+    assert list(bounded.step_history) == full.step_history[-5:]
+
+    indices = [i for steps in bounded.turn_map.values() for i in steps]
+    assert indices == [s.global_step_index for s in bounded.step_history]
+    for i in indices:
+        assert bounded.get_step(i).global_step_index == i
+        assert bounded.log_html(bounded.get_step(i)) == full.log_html(full.get_step(i))
+
+    assert len(bounded._html_cache) <= 5  # pyright: ignore[reportPrivateUsage]
@@ -50,6 +50,28 @@ def test_copycat_deterministic_tie_break(scenario: type[GameScenario]):
     assert "GunkSlime" not in copycat_abilities
 
 
+def test_copycat_sorted_abilities_follow_copy(scenario: type[GameScenario]):
+    """
+    Scenario: Copycat's sorted ability view is read before and after it copies Centaur.
+    Verify: The cached view is refreshed when the copy changes its abilities.
+    """
+    game = scenario(
+        [
+            RacerConfig(0, "Copycat", start_pos=0),
+            RacerConfig(1, "Centaur", start_pos=10),
+        ],
+        dice_rolls=[4],
+    )
+    before = game.get_racer(0).sorted_abilities()
+
+    game.run_turn()  # Copycat's turn
+
+    after = game.get_racer(0).sorted_abilities()
+    assert after != before
+    assert after == tuple(sorted(game.get_racer(0).abilities))
+    assert "CentaurTrample" in after
+
+
 def test_copycat_ability_loss_and_modifier_cleanup(scenario: type[GameScenario]):
     """
     Scenario: Copycat copies HugeBaby, placing a blocker. Next turn, a new leader appears.